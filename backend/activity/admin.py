@@ -0,0 +1,24 @@
+from django.contrib import admin
+from core.admin_pagination import EstimatedCountPaginator
+from .models import Activity
+
+
+@admin.register(Activity)
+class ActivityAdmin(admin.ModelAdmin):
+    """
+    Read-only admin interface for the append-only activity log.
+    """
+    list_display = ['created_at', 'board', 'actor', 'verb', 'target_type', 'target_label']
+    list_filter = ['verb', 'target_type', 'board']
+    list_select_related = ['board', 'actor']
+    search_fields = ['target_label']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def has_add_permission(self, request):
+        """Entries are only written by the activity log."""
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        """The log is append-only."""
+        return False
@@ -0,0 +1,23 @@
+from rest_framework import serializers
+from activity.models import Activity
+
+
+class ActivitySerializer(serializers.ModelSerializer):
+    """
+    Serializer for activity log entries.
+    """
+    actor_name = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Activity
+        fields = [
+            'id', 'actor', 'actor_name', 'verb', 'target_type', 'target_id',
+            'target_label', 'changes', 'created_at',
+        ]
+        read_only_fields = fields
+
+    def get_actor_name(self, obj):
+        """Return the display name of the acting user, if still present."""
+        if obj.actor is None:
+            return None
+        return obj.actor.name or obj.actor.email
@@ -0,0 +1,39 @@
+from rest_framework import viewsets, permissions
+from rest_framework.pagination import CursorPagination
+from django_filters.rest_framework import DjangoFilterBackend
+from activity.models import Activity
+from boards.scoping import BoardScopedMixin
+from .serializers import ActivitySerializer
+
+
+class ActivityPagination(CursorPagination):
+    """
+    Newest-first cursor pagination in insert order, stable while new
+    entries arrive. Entries are inserted in buffered batches, so an entry
+    may be written after others with a later `created_at`; ordering by
+    `id` keeps such late entries from slipping behind a cursor.
+    """
+    ordering = '-id'
+    page_size = 50
+    page_size_query_param = 'limit'
+    max_page_size = 200
+
+
+class ActivityViewSet(BoardScopedMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    Read-only feed of the activity log of the current board.
+    
+    Supports:
+    - Filtering by verb, target_type, target_id, actor
+    - Cursor pagination (`?cursor=...&limit=50`)
+    """
+    queryset = Activity.objects.all()
+    serializer_class = ActivitySerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = ActivityPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ['verb', 'target_type', 'target_id', 'actor']
+
+    def get_queryset(self):
+        """Scope entries to the board, with the acting users."""
+        return Activity.objects.filter(board=self.board).select_related('actor')
@@ -0,0 +1,160 @@
+"""
+Buffered capture of activity log entries.
+
+Entries are collected in process and inserted with one `bulk_create`
+once ACTIVITY_BUFFER_SIZE entries are waiting, ACTIVITY_FLUSH_INTERVAL
+seconds after the first waiting entry, and at interpreter shutdown. This
+keeps the audit trail from adding an INSERT to every write request; the
+price is that entries of a crashed process that were not flushed yet
+are lost.
+"""
+import atexit
+import logging
+import os
+import threading
+
+from django.conf import settings
+from django.db import DatabaseError, connections, transaction
+from django.utils import timezone
+
+from .models import Activity
+
+logger = logging.getLogger(__name__)
+
+
+class ActivityBuffer:
+    """Thread-safe list of unsaved Activity rows with size and age limits."""
+
+    def __init__(self, max_size, max_age):
+        self.max_size = max_size
+        self.max_age = max_age
+        self._rows = []
+        self._lock = threading.Lock()
+        self._timer = None
+
+    def add(self, row):
+        """Buffer a row; flush when full, otherwise make sure a timer runs."""
+        with self._lock:
+            self._rows.append(row)
+            full = len(self._rows) >= self.max_size
+            if not full and self._timer is None:
+                self._timer = threading.Timer(self.max_age, self._flush_from_timer)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self.flush()
+
+    def _take(self):
+        """Empty the buffer and cancel its timer; return the taken rows."""
+        with self._lock:
+            rows, self._rows = self._rows, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        return rows
+
+    def flush(self):
+        """Insert all buffered rows with one bulk_create; return how many."""
+        rows = self._take()
+        if not rows:
+            return 0
+        try:
+            Activity.objects.bulk_create(rows, batch_size=500)
+        except DatabaseError:
+            logger.exception('Dropped %d activity entries', len(rows))
+        return len(rows)
+
+    def _flush_from_timer(self):
+        """Flush from the timer thread and release its database connection."""
+        try:
+            self.flush()
+        finally:
+            connections.close_all()
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_buffer():
+    """Return the process-wide buffer, creating it on first use."""
+    global _buffer
+    with _buffer_lock:
+        if _buffer is None:
+            _buffer = ActivityBuffer(settings.ACTIVITY_BUFFER_SIZE, settings.ACTIVITY_FLUSH_INTERVAL)
+        return _buffer
+
+
+def flush():
+    """Write the entries waiting in this process; return how many."""
+    return _buffer.flush() if _buffer is not None else 0
+
+
+def _reset_after_fork():
+    """Give a forked worker its own buffer; the parent flushes its own rows."""
+    global _buffer, _buffer_lock
+    _buffer, _buffer_lock = None, threading.Lock()
+
+
+atexit.register(flush)
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _label(target):
+    """Return a short human-readable name of a task or contact."""
+    title = getattr(target, 'title', None)
+    if title is None:
+        title = f'{target.firstname} {target.lastname}'.strip()
+    return title[:255]
+
+
+def record(request, verb, target, changes=None):
+    """Log `verb` on `target` by the request's user once the write commits."""
+    user = getattr(request, 'user', None)
+    row = Activity(
+        board_id=target.board_id,
+        actor_id=user.pk if user is not None and user.is_authenticated else None,
+        verb=verb,
+        target_type=target._meta.model_name,
+        target_id=target.pk,
+        target_label=_label(target),
+        changes=changes or {},
+        created_at=timezone.now(),
+    )
+    transaction.on_commit(lambda: get_buffer().add(row))
+
+
+def _field_changes(instance, validated_data):
+    """Return the names of plain model fields whose incoming value differs."""
+    concrete = {field.name for field in instance._meta.concrete_fields}
+    return [
+        name for name, value in validated_data.items()
+        if name in concrete and getattr(instance, name) != value
+    ]
+
+
+class ActivityLogMixin:
+    """
+    ModelViewSet mixin recording create, update and delete events.
+    Serializers that know their changes better can set `activity_changes`
+    in `update()`; an empty dict there means nothing is logged.
+    """
+
+    def perform_create(self, serializer):
+        """Log the created object."""
+        super().perform_create(serializer)
+        record(self.request, 'created', serializer.instance)
+
+    def perform_update(self, serializer):
+        """Log the changed fields, if any."""
+        fields = _field_changes(serializer.instance, serializer.validated_data)
+        super().perform_update(serializer)
+        changes = getattr(serializer, 'activity_changes', {'fields': fields} if fields else {})
+        if changes:
+            record(self.request, 'updated', serializer.instance, changes)
+
+    def perform_destroy(self, instance):
+        """Log the deleted object if the delete commits."""
+        with transaction.atomic():
+            record(self.request, 'deleted', instance)
+            super().perform_destroy(instance)
@@ -0,0 +1,39 @@
+# Generated by Django 6.0.2 on 2026-10-19 17:33
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('boards', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Activity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('verb', models.CharField(choices=[('created', 'Created'), ('updated', 'Updated'), ('deleted', 'Deleted'), ('status_changed', 'Status changed'), ('subtask_toggled', 'Subtask toggled'), ('restored', 'Restored')], max_length=20)),
+                ('target_type', models.CharField(max_length=20)),
+                ('target_id', models.BigIntegerField()),
+                ('target_label', models.CharField(blank=True, default='', max_length=255)),
+                ('changes', models.JSONField(blank=True, default=dict)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('actor', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('board', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='activities', to='boards.board')),
+            ],
+            options={
+                'verbose_name_plural': 'Activities',
+                'db_table': 'activities',
+                'ordering': ['-created_at', '-id'],
+                'indexes': [models.Index(fields=['board', '-created_at'], name='activities_board_created_idx'), models.Index(fields=['board', 'target_type', 'target_id', '-created_at'], name='activities_board_target_idx')],
+            },
+        ),
+    ]
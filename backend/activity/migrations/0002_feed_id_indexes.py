@@ -0,0 +1,25 @@
+# Generated by Django 6.0.2 on 2026-10-19 18:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('activity', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='activity',
+            name='activities_board_target_idx',
+        ),
+        migrations.AddIndex(
+            model_name='activity',
+            index=models.Index(fields=['board', '-id'], name='activities_board_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='activity',
+            index=models.Index(fields=['board', 'target_type', 'target_id', '-id'], name='activities_board_target_id_idx'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+from boards.models import Board
+
+
+class Activity(models.Model):
+    """
+    Append-only log entry describing who changed which task or contact.
+    The target is stored by type and id (no foreign key), so entries
+    outlive deleted and archived objects.
+    """
+    VERB_CHOICES = [
+        ('created', 'Created'),
+        ('updated', 'Updated'),
+        ('deleted', 'Deleted'),
+        ('status_changed', 'Status changed'),
+        ('subtask_toggled', 'Subtask toggled'),
+        ('restored', 'Restored'),
+    ]
+
+    board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name='activities')
+    actor = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name='+'
+    )
+    verb = models.CharField(max_length=20, choices=VERB_CHOICES)
+    target_type = models.CharField(max_length=20)
+    target_id = models.BigIntegerField()
+    target_label = models.CharField(max_length=255, blank=True, default='')
+    changes = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['-created_at', '-id']
+        db_table = 'activities'
+        verbose_name_plural = 'Activities'
+        indexes = [
+            models.Index(fields=['board', '-created_at'], name='activities_board_created_idx'),
+            models.Index(fields=['board', '-id'], name='activities_board_id_idx'),
+            models.Index(
+                fields=['board', 'target_type', 'target_id', '-id'],
+                name='activities_board_target_id_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.get_verb_display()} {self.target_type} {self.target_label}"
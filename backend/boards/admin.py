@@ -0,0 +1,14 @@
+from django.contrib import admin
+from .models import Board
+
+
+@admin.register(Board)
+class BoardAdmin(admin.ModelAdmin):
+    """
+    Admin interface for Board model.
+    """
+    list_display = ['name', 'is_default', 'created_at']
+    list_filter = ['is_default']
+    search_fields = ['name']
+    readonly_fields = ['created_at', 'updated_at']
+    autocomplete_fields = ['members']
@@ -0,0 +1,13 @@
+from rest_framework import serializers
+from boards.models import Board
+
+
+class BoardSerializer(serializers.ModelSerializer):
+    """
+    Serializer for Board model.
+    Members are managed in the admin and exposed read-only.
+    """
+    class Meta:
+        model = Board
+        fields = ['id', 'name', 'is_default', 'members', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'is_default', 'members', 'created_at', 'updated_at']
@@ -0,0 +1,24 @@
+from rest_framework import viewsets, permissions
+from boards.models import Board
+from .serializers import BoardSerializer
+
+
+class BoardViewSet(viewsets.ModelViewSet):
+    """
+    ViewSet for Board model.
+    Lists the boards the user can access and lets users create new ones.
+    The creator becomes the first member of a new board.
+    """
+    queryset = Board.objects.all()
+    serializer_class = BoardSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    http_method_names = ['get', 'post', 'head', 'options']
+
+    def get_queryset(self):
+        """Return the default board and the user's own boards."""
+        return Board.objects.accessible_to(self.request.user).prefetch_related('members')
+
+    def perform_create(self, serializer):
+        """Add the creator as member of the new board."""
+        board = serializer.save()
+        board.members.add(self.request.user)
@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class BoardsConfig(AppConfig):
+    name = 'boards'
+
+    def ready(self):
+        """Connect signal handlers."""
+        from . import signals  # noqa: F401
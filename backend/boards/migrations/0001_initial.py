@@ -0,0 +1,39 @@
+# Generated by Django 6.0.2 on 2026-10-19 17:25
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def create_default_board(apps, schema_editor):
+    """Create the shared default board that existing rows move into."""
+    Board = apps.get_model('boards', 'Board')
+    Board.objects.get_or_create(is_default=True, defaults={'name': 'Default'})
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Board',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('is_default', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('members', models.ManyToManyField(blank=True, related_name='boards', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'boards',
+                'ordering': ['name'],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('is_default', True)), fields=('is_default',), name='boards_single_default')],
+            },
+        ),
+        migrations.RunPython(create_default_board, migrations.RunPython.noop),
+    ]
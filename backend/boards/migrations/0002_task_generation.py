@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-19 18:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='board',
+            name='task_generation',
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -0,0 +1,89 @@
+import copy
+
+from django.conf import settings
+from django.db import models
+from django.db.models import Q
+
+_default_board = None
+
+
+class BoardQuerySet(models.QuerySet):
+    """QuerySet helpers for board access checks."""
+
+    def accessible_to(self, user):
+        """Boards the user may read: the default board plus own memberships."""
+        return self.filter(Q(is_default=True) | Q(members=user)).distinct()
+
+
+class Board(models.Model):
+    """
+    Board model partitioning tasks, subtasks and contacts per team.
+    The default board is shared by all authenticated users.
+    """
+    name = models.CharField(max_length=100)
+    is_default = models.BooleanField(default=False)
+    members = models.ManyToManyField(settings.AUTH_USER_MODEL, related_name='boards', blank=True)
+    # Advanced once per transaction that changes the board's tasks (task read model)
+    task_generation = models.PositiveBigIntegerField(default=0, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = BoardQuerySet.as_manager()
+
+    class Meta:
+        ordering = ['name']
+        db_table = 'boards'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['is_default'],
+                condition=Q(is_default=True),
+                name='boards_single_default',
+            ),
+        ]
+
+    def __str__(self):
+        return self.name
+
+    def save(self, *args, **kwargs):
+        """Save the board without writing back a possibly outdated task generation."""
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'task_generation'
+            ]
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def advance_task_generation(cls, board_id):
+        """
+        Advance the task generation of a board within the current transaction
+        and return the new value (None if the board does not exist).
+        """
+        boards = cls.objects.filter(pk=board_id)
+        boards.update(task_generation=models.F('task_generation') + 1)
+        return boards.values_list('task_generation', flat=True).first()
+
+    @classmethod
+    def get_default(cls):
+        """
+        Return the shared default board, creating it on first use. It is
+        looked up once per process and handed out as a copy.
+        """
+        global _default_board
+        if _default_board is None:
+            _default_board, _ = cls.objects.get_or_create(is_default=True, defaults={'name': 'Default'})
+        return copy.copy(_default_board)
+
+    @classmethod
+    async def aget_default(cls):
+        """Async variant of `get_default`."""
+        global _default_board
+        if _default_board is None:
+            _default_board, _ = await cls.objects.aget_or_create(is_default=True, defaults={'name': 'Default'})
+        return copy.copy(_default_board)
+
+    @staticmethod
+    def forget_default():
+        """Drop the cached default board, e.g. after it was deleted."""
+        global _default_board
+        _default_board = None
@@ -0,0 +1,73 @@
+"""
+Resolution of the board a request operates on.
+
+Clients select a board with the `X-Board` header or the `board` query
+parameter. Without either, the shared default board is used, so clients
+that do not know about boards keep working unchanged.
+"""
+from rest_framework.exceptions import NotFound
+from .models import Board
+
+BOARD_HEADER = 'X-Board'
+BOARD_PARAM = 'board'
+
+
+def requested_board_id(request):
+    """Return the board id requested by the client, or None."""
+    return request.headers.get(BOARD_HEADER) or request.query_params.get(BOARD_PARAM)
+
+
+def resolve_board(request, user):
+    """Return the requested board if the user may access it."""
+    board_id = requested_board_id(request)
+    if not board_id:
+        return Board.get_default()
+    try:
+        return Board.objects.accessible_to(user).get(pk=board_id)
+    except (Board.DoesNotExist, ValueError):
+        raise NotFound('Board not found.')
+
+
+async def aresolve_board(request, user):
+    """Async variant of `resolve_board`."""
+    board_id = requested_board_id(request)
+    if not board_id:
+        return await Board.aget_default()
+    try:
+        return await Board.objects.accessible_to(user).aget(pk=board_id)
+    except (Board.DoesNotExist, ValueError):
+        raise NotFound('Board not found.')
+
+
+def board_namespace(namespace, board_id):
+    """Return the response cache namespace of a board."""
+    return f'{namespace}:{board_id}'
+
+
+class BoardScopedMixin:
+    """
+    ViewSet mixin that resolves `self.board` for every request, stores new
+    objects on it and passes it to serializers. Viewsets filter their
+    querysets with `board=self.board`.
+    """
+    board_scoped = True
+    board = None
+
+    def initial(self, request, *args, **kwargs):
+        """Resolve the board after authentication."""
+        super().initial(request, *args, **kwargs)
+        self.board = resolve_board(request, request.user)
+
+    def get_serializer_context(self):
+        """Expose the board to serializers."""
+        context = super().get_serializer_context()
+        context['board'] = self.board
+        return context
+
+    def get_cache_namespace(self):
+        """Keep cached responses of different boards apart."""
+        return board_namespace(super().get_cache_namespace(), self.board.pk)
+
+    def perform_create(self, serializer):
+        """Create new objects on the current board."""
+        serializer.save(board=self.board)
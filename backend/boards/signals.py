@@ -0,0 +1,13 @@
+"""
+Signal handlers keeping the per-process default board cache valid.
+"""
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from .models import Board
+
+
+@receiver(post_delete, sender=Board)
+def forget_deleted_default(sender, instance, **kwargs):
+    """Forget the cached default board once it is deleted."""
+    if instance.is_default:
+        Board.forget_default()
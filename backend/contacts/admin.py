@@ -1,4 +1,5 @@
 from django.contrib import admin
+from core.admin_pagination import EstimatedCountPaginator
 from .models import Contact
 
 
@@ -7,8 +8,18 @@ class ContactAdmin(admin.ModelAdmin):
     """
     Admin interface for Contact model.
     """
-    list_display = ['firstname', 'lastname', 'email', 'phone', 'created_at']
-    list_filter = ['created_at']
+    list_display = ['firstname', 'lastname', 'email', 'phone', 'board', 'created_at']
+    list_filter = ['board', 'created_at']
+    list_select_related = ['board']
     search_fields = ['firstname', 'lastname', 'email', 'phone']
     readonly_fields = ['created_at', 'updated_at']
     ordering = ['firstname', 'lastname']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_search_results(self, request, queryset, search_term):
+        """Limit autocomplete results to the board a task form asks for."""
+        board_id = request.GET.get('board', '') if 'field_name' in request.GET else ''
+        if board_id.isdigit():
+            queryset = queryset.filter(board_id=board_id)
+        return super().get_search_results(request, queryset, search_term)
@@ -0,0 +1,33 @@
+"""
+Native async read views for contacts, used when ASYNC_READ_VIEWS is enabled.
+"""
+from core.async_api import async_read_view, alist, aretrieve
+from .views import ContactViewSet
+
+contact_list_fallback = ContactViewSet.as_view({'get': 'list', 'post': 'create'})
+contact_detail_fallback = ContactViewSet.as_view({
+    'get': 'retrieve',
+    'put': 'update',
+    'patch': 'partial_update',
+    'delete': 'destroy',
+})
+
+
+@async_read_view(contact_list_fallback)
+async def contact_list(request):
+    """
+    List contacts using the async ORM.
+
+    GET /api/contacts/
+    """
+    return await alist(ContactViewSet, request)
+
+
+@async_read_view(contact_detail_fallback)
+async def contact_detail(request, pk):
+    """
+    Retrieve a single contact using the async ORM.
+
+    GET /api/contacts/{id}/
+    """
+    return await aretrieve(ContactViewSet, request, pk)
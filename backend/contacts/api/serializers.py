@@ -1,13 +1,47 @@
 from rest_framework import serializers
 from contacts.models import Contact
 
+BULK_DELETE_MAX_IDS = 1000
+
 
 class ContactSerializer(serializers.ModelSerializer):
     """
     Serializer for Contact model.
     Handles serialization/deserialization of contact data.
     """
+    assigned_task_count = serializers.SerializerMethodField()
+
     class Meta:
         model = Contact
-        fields = ['id', 'email', 'firstname', 'lastname', 'phone', 'created_at', 'updated_at']
+        fields = [
+            'id', 'email', 'firstname', 'lastname', 'phone',
+            'assigned_task_count', 'created_at', 'updated_at',
+        ]
         read_only_fields = ['id', 'created_at', 'updated_at']
+
+    def get_assigned_task_count(self, instance):
+        """Use the annotated count; a contact loaded without it (just created) has none."""
+        return getattr(instance, 'assigned_task_count', 0)
+
+    def validate_email(self, value):
+        """Ensure the email is unique within the board of the request."""
+        board = self.context.get('board')
+        if board is None:
+            return value
+        duplicates = Contact.objects.filter(board=board, email=value)
+        if self.instance is not None:
+            duplicates = duplicates.exclude(pk=self.instance.pk)
+        if duplicates.exists():
+            raise serializers.ValidationError('contact with this email already exists.')
+        return value
+
+
+class BulkDeleteSerializer(serializers.Serializer):
+    """
+    Validates a bulk delete request: the contact ids and whether to only
+    report the impact (`dry_run`).
+    """
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), min_length=1, max_length=BULK_DELETE_MAX_IDS
+    )
+    dry_run = serializers.BooleanField(default=False)
@@ -1,10 +1,20 @@
-from django.urls import path, include
+from django.conf import settings
+from django.urls import path, re_path, include
 from rest_framework.routers import DefaultRouter
 from .views import ContactViewSet
+from . import async_views
 
 router = DefaultRouter()
 router.register(r'contacts', ContactViewSet, basename='contact')
 
-urlpatterns = [
+urlpatterns = []
+
+if settings.ASYNC_READ_VIEWS:
+    urlpatterns += [
+        re_path(r'^contacts/$', async_views.contact_list, name='contact-list-async'),
+        re_path(r'^contacts/(?P<pk>[0-9]+)/$', async_views.contact_detail, name='contact-detail-async'),
+    ]
+
+urlpatterns += [
     path('', include(router.urls)),
 ]
@@ -1,20 +1,32 @@
 from rest_framework import viewsets, permissions, filters
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from django.db import transaction
 from django_filters.rest_framework import DjangoFilterBackend
+from activity.log import ActivityLogMixin, record
+from boards.scoping import BoardScopedMixin
+from core.response_cache import CachedResponseMixin
+from contacts.bulk import delete_contacts, delete_impact
 from contacts.models import Contact
-from .serializers import ContactSerializer
+from .serializers import ContactSerializer, BulkDeleteSerializer
 
 
-class ContactViewSet(viewsets.ModelViewSet):
+class ContactViewSet(ActivityLogMixin, BoardScopedMixin, CachedResponseMixin, viewsets.ModelViewSet):
     """
     ViewSet for Contact model.
-    Provides CRUD operations for shared contacts.
-    All authenticated users can access and manage contacts.
+    Provides CRUD operations for the contacts of the current board
+    (`X-Board` header or `board` parameter, default board otherwise).
     
     Supports:
     - Filtering by email, firstname, lastname
     - Searching across firstname, lastname, email, phone
-    - Ordering by any field
+    - Ordering by any field, including `assigned_task_count`
+    - Task assignment counts per contact from one grouped query
+    - Batched deletes of several contacts via the `bulk_delete` action
+    - Shared response cache for list and retrieve
+    - Activity log entries for every change
     """
+    cache_namespace = 'contacts'
     queryset = Contact.objects.all()
     serializer_class = ContactSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -23,3 +35,30 @@ class ContactViewSet(viewsets.ModelViewSet):
     search_fields = ['firstname', 'lastname', 'email', 'phone']
     ordering_fields = '__all__'
     ordering = ['firstname', 'lastname']
+
+    def get_queryset(self):
+        """Scope contacts to the board of the request and count their tasks."""
+        return Contact.objects.filter(board=self.board).with_assignment_counts()
+
+    @action(detail=False, methods=['post'])
+    def bulk_delete(self, request):
+        """
+        Delete several contacts of the board at once, clearing their task
+        assignments with one statement per batch. Unknown ids are ignored.
+        With `dry_run` only the impact is reported.
+
+        POST /api/contacts/bulk_delete/
+        {
+            "ids": [3, 7, 12],
+            "dry_run": false
+        }
+        """
+        serializer = BulkDeleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        contacts = Contact.objects.filter(board=self.board, id__in=serializer.validated_data['ids'])
+        if serializer.validated_data['dry_run']:
+            return Response(delete_impact(contacts))
+        with transaction.atomic():
+            for contact in contacts:
+                record(request, 'deleted', contact)
+            return Response(delete_contacts([contact.id for contact in contacts]))
@@ -0,0 +1,15 @@
+"""
+Background jobs for contacts.
+"""
+from boards.models import Board
+from core.response_cache import warm_list
+from jobs.queue import job
+from .api.views import ContactViewSet
+
+
+@job('contacts.warm_list')
+def warm_contact_list(board_id):
+    """Refill the cached contact list of a board after it was invalidated."""
+    board = Board.objects.filter(pk=board_id).first()
+    if board is not None:
+        warm_list(ContactViewSet, board)
@@ -0,0 +1,29 @@
+# Generated by Django 6.0.2 on 2026-10-19 17:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def assign_default_board(apps, schema_editor):
+    """Move all existing contacts into the default board."""
+    Board = apps.get_model('boards', 'Board')
+    Contact = apps.get_model('contacts', 'Contact')
+    board = Board.objects.get(is_default=True)
+    Contact.objects.filter(board__isnull=True).update(board=board)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0001_initial'),
+        ('contacts', '0002_admin_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contact',
+            name='board',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='contacts', to='boards.board'),
+        ),
+        migrations.RunPython(assign_default_board, migrations.RunPython.noop),
+    ]
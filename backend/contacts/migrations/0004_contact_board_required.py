@@ -0,0 +1,44 @@
+# Generated by Django 6.0.2 on 2026-10-19 17:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contacts', '0003_contact_board'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='contact',
+            name='board',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='contacts', to='boards.board'),
+        ),
+        migrations.AlterField(
+            model_name='contact',
+            name='email',
+            field=models.EmailField(max_length=254),
+        ),
+        migrations.RemoveIndex(
+            model_name='contact',
+            name='contacts_name_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='contact',
+            name='contacts_created_at_idx',
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['board', 'firstname', 'lastname'], name='contacts_board_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['board', 'created_at'], name='contacts_board_created_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='contact',
+            constraint=models.UniqueConstraint(fields=('board', 'email'), name='contacts_board_email_uniq'),
+        ),
+    ]
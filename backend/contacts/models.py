@@ -1,21 +1,43 @@
 from django.db import models
+from django.db.models import Count
+from boards.models import Board
+
+
+class ContactQuerySet(models.QuerySet):
+    """QuerySet helpers for contact listings."""
+
+    def with_assignment_counts(self):
+        """Annotate each contact with the number of tasks assigned to it (one grouped query)."""
+        return self.annotate(assigned_task_count=Count('assigned_tasks'))
 
 
 class Contact(models.Model):
     """
-    Contact model representing a shared contact entry.
-    Contacts are accessible by all authenticated users.
+    Contact model representing a contact entry of a board.
+    Contacts are accessible by all users with access to the board.
     """
-    email = models.EmailField(unique=True)
+    board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name='contacts')
+    email = models.EmailField()
     firstname = models.CharField(max_length=100)
     lastname = models.CharField(max_length=100, blank=True, default='')
     phone = models.CharField(max_length=50)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ContactQuerySet.as_manager()
+
     class Meta:
         ordering = ['firstname', 'lastname']
         db_table = 'contacts'
+        indexes = [
+            models.Index(fields=['board', 'firstname', 'lastname'], name='contacts_board_name_idx'),
+            models.Index(fields=['board', 'created_at'], name='contacts_board_created_idx'),
+            models.Index(fields=['firstname', 'lastname'], name='contacts_name_idx'),
+            models.Index(fields=['created_at'], name='contacts_created_at_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['board', 'email'], name='contacts_board_email_uniq'),
+        ]
 
     def __str__(self):
         return f"{self.firstname} {self.lastname} ({self.email})"
@@ -0,0 +1,40 @@
+"""
+Signal handlers that invalidate (and optionally refill) cached contact responses.
+"""
+from django.conf import settings
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from boards.scoping import board_namespace
+from core.response_cache import bump_generation
+from jobs.queue import enqueue_on_commit
+from tasks import read_model
+from .models import Contact
+
+
+def _warm(board_id, *job_names):
+    """Schedule refills of the board's list caches, if enabled."""
+    if settings.RESPONSE_CACHE_WARM:
+        for name in job_names:
+            enqueue_on_commit(name, board_id=board_id)
+
+
+@receiver(post_save, sender=Contact)
+def invalidate_contact_responses(sender, instance, **kwargs):
+    """Invalidate cached contact responses of the board after a write."""
+    bump_generation(board_namespace('contacts', instance.board_id))
+    _warm(instance.board_id, 'contacts.warm_list')
+
+
+@receiver(post_delete, sender=Contact)
+def invalidate_contact_delete(sender, instance, **kwargs):
+    """
+    Invalidate contacts and tasks of the board after a delete.
+    The cascade on the assignment table sends no m2m_changed signal.
+    """
+    bump_generation(
+        board_namespace('contacts', instance.board_id),
+        board_namespace('tasks', instance.board_id),
+    )
+    _warm(instance.board_id, 'contacts.warm_list', 'tasks.warm_list')
+    if settings.TASK_READ_MODEL:
+        read_model.tasks_changed(instance.board_id)
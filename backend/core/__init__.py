@@ -0,0 +1,4 @@
+import time
+
+# Fallback reference for startup timings where the process start time is unknown
+IMPORTED_AT = time.perf_counter()
@@ -0,0 +1,48 @@
+"""
+Admin helpers that keep changelists fast on large tables.
+"""
+from django.core.paginator import Paginator
+from django.db import DatabaseError, connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+
+ESTIMATE_QUERIES = {
+    'postgresql': 'SELECT reltuples::bigint FROM pg_class WHERE relname = %s',
+    'sqlite': 'SELECT stat FROM sqlite_stat1 WHERE tbl = %s LIMIT 1',
+}
+
+
+def estimated_row_count(queryset):
+    """
+    Return the planner's row estimate for an unfiltered queryset, or None
+    if the queryset is filtered or the database keeps no statistics.
+    """
+    if not isinstance(queryset, QuerySet) or queryset.query.where:
+        return None
+    connection = connections[queryset.db]
+    sql = ESTIMATE_QUERIES.get(connection.vendor)
+    if sql is None:
+        return None
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [queryset.model._meta.db_table])
+            row = cursor.fetchone()
+    except DatabaseError:
+        return None
+    return int(str(row[0]).split()[0]) if row else None
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that trusts the table statistics instead of COUNT(*) for
+    large unfiltered changelists. Small or filtered lists are counted exactly.
+    """
+    exact_count_threshold = 10000
+
+    @cached_property
+    def count(self):
+        """Return the estimated or exact number of objects."""
+        estimate = estimated_row_count(self.object_list)
+        if estimate is None or estimate < self.exact_count_threshold:
+            return super().count
+        return estimate
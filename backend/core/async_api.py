@@ -0,0 +1,179 @@
+"""
+Helpers for native async read endpoints served under ASGI.
+
+The async views mirror the DRF read paths (authentication, response
+format and error bodies) without occupying a worker thread while they
+wait on the database. Write methods are delegated to the regular
+synchronous DRF views.
+"""
+import math
+from functools import partial, wraps
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.http import HttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import NotFound, Throttled, ValidationError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from boards.scoping import aresolve_board
+from core import response_cache
+from core.throttling import ReadThrottle
+
+NOT_AUTHENTICATED = 'Authentication credentials were not provided.'
+INVALID_TOKEN = 'Invalid token.'
+INACTIVE_USER = 'User inactive or deleted.'
+
+
+def json_response(data, status=200):
+    """Render data with DRF's JSON renderer into a plain Django response."""
+    content = JSONRenderer().render(data)
+    return HttpResponse(content, status=status, content_type='application/json')
+
+
+def _unauthorized(detail):
+    """Build a 401 response matching DRF's TokenAuthentication."""
+    response = json_response({'detail': detail}, status=401)
+    response['WWW-Authenticate'] = 'Token'
+    return response
+
+
+async def _token_user(key):
+    """Resolve a token key to its user, or return an error detail."""
+    try:
+        token = await Token.objects.select_related('user').aget(key=key)
+    except Token.DoesNotExist:
+        return None, INVALID_TOKEN
+    if not token.user.is_active:
+        return None, INACTIVE_USER
+    return token.user, None
+
+
+async def aauthenticate(request):
+    """
+    Authenticate via `Authorization: Token <key>` or the session.
+    Returns a tuple of (user, error_detail).
+    """
+    parts = request.headers.get('Authorization', '').split()
+    if parts and parts[0].lower() == 'token':
+        if len(parts) != 2:
+            return None, INVALID_TOKEN
+        return await _token_user(parts[1])
+    user = await request.auser()
+    if user.is_authenticated:
+        return user, None
+    return None, NOT_AUTHENTICATED
+
+
+async def _abuild_view(viewset_class, request, action):
+    """
+    Instantiate a viewset for the request without dispatching it.
+    Board-scoped viewsets get their board resolved asynchronously.
+    """
+    view = viewset_class(action=action, kwargs={}, format_kwarg=None)
+    view.request = Request(request)
+    if getattr(view, 'board_scoped', False):
+        view.board = await aresolve_board(view.request, request.user)
+    return view
+
+
+async def _alist_data(view):
+    """
+    Return the serialized list data of a view and its status, taken from
+    the view's in-memory read model if it has one that can answer.
+    """
+    read_model_data = getattr(view, 'read_model_data', None)
+    data = await sync_to_async(read_model_data)() if read_model_data else None
+    if data is not None:
+        return data, 200
+    try:
+        queryset = view.filter_queryset(view.get_queryset())
+    except ValidationError as exc:
+        return exc.detail, 400
+    objects = [obj async for obj in queryset.aiterator()]
+    return view.get_serializer(objects, many=True).data, 200
+
+
+async def _aretrieve_data(view, pk):
+    """Return the serialized detail data of a view and its status."""
+    queryset = view.get_queryset()
+    model = queryset.model
+    try:
+        instance = await queryset.aget(pk=pk)
+    except (model.DoesNotExist, TypeError, ValueError, DjangoValidationError):
+        return {'detail': f'No {model._meta.object_name} matches the given query.'}, 404
+    return view.get_serializer(instance).data, 200
+
+
+async def _acached_response(view, request, producer, pk=None):
+    """Serve data through the view's response cache namespace."""
+    key = response_cache.build_key(view.get_cache_namespace(), view.action, request.GET, pk)
+    data = response_cache.lookup(key)
+    if data is not None:
+        response = json_response(data)
+        response['X-Cache'] = 'HIT'
+        return response
+    data, status = await producer()
+    if status == 200:
+        response_cache.store(key, data)
+    response = json_response(data, status=status)
+    response['X-Cache'] = 'MISS'
+    return response
+
+
+async def _aserve(viewset_class, request, action, pk=None):
+    """Build the view for an action and serve it through the cache."""
+    try:
+        view = await _abuild_view(viewset_class, request, action)
+    except NotFound as exc:
+        return json_response({'detail': exc.detail}, status=404)
+    if pk is None:
+        producer = partial(_alist_data, view)
+    else:
+        producer = partial(_aretrieve_data, view, pk)
+    return await _acached_response(view, request, producer, pk)
+
+
+async def alist(viewset_class, request):
+    """Return the serialized list response of a viewset."""
+    return await _aserve(viewset_class, request, 'list')
+
+
+async def aretrieve(viewset_class, request, pk):
+    """Return the serialized detail response of a viewset, or 404."""
+    return await _aserve(viewset_class, request, 'retrieve', pk)
+
+
+def _throttled(request):
+    """Apply the read budget; return a 429 response if it is exhausted."""
+    throttle = ReadThrottle()
+    if throttle.allow_request(request, None):
+        return None
+    wait = throttle.wait()
+    response = json_response({'detail': Throttled(wait).detail}, status=429)
+    response['Retry-After'] = str(math.ceil(wait))
+    return response
+
+
+def async_read_view(fallback_view):
+    """
+    Serve GET requests with the decorated coroutine and delegate every
+    other method to the synchronous `fallback_view`, which is also exposed
+    as `sync_view` for callers that run synchronously (e.g. the batch API).
+    """
+    def decorator(handler):
+        @wraps(handler)
+        async def view(request, *args, **kwargs):
+            if request.method != 'GET':
+                return await sync_to_async(fallback_view)(request, *args, **kwargs)
+            user, error = await aauthenticate(request)
+            if error:
+                return _unauthorized(error)
+            request.user = user
+            return _throttled(request) or await handler(request, *args, **kwargs)
+        view = csrf_exempt(view)
+        view.sync_view = fallback_view
+        return view
+    return decorator
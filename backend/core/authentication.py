@@ -0,0 +1,19 @@
+"""
+Authentication classes shared by the API.
+"""
+from rest_framework.authentication import BaseAuthentication
+
+
+class BatchSubRequestAuthentication(BaseAuthentication):
+    """
+    Authenticate a batch sub-request as the user of its outer request.
+    The credentials are attached server-side, clients cannot set them.
+    """
+
+    def authenticate(self, request):
+        """Return the outer request's (user, auth), or None for other requests."""
+        return getattr(request._request, 'batch_credentials', None)
+
+    def authenticate_header(self, request):
+        """Keep answering unauthenticated requests with `401` like TokenAuthentication."""
+        return 'Token'
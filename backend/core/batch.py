@@ -0,0 +1,112 @@
+"""
+Batched read requests for app bootstrap.
+
+`POST /api/batch/` runs several GET requests against the regular URL
+conf inside one HTTP request. Sub-requests reuse the outer request's
+authentication and database connection and skip the middleware stack,
+so a cold app load costs one round trip instead of one per resource.
+"""
+import json
+from contextlib import contextmanager, nullcontext
+from urllib.parse import urlsplit
+
+from django.db import connection, transaction
+from django.http import HttpRequest, QueryDict
+from django.urls import Resolver404, resolve
+from rest_framework import serializers
+from rest_framework.decorators import api_view, throttle_classes
+from rest_framework.response import Response
+
+BATCH_MAX_REQUESTS = 20
+DROPPED_HEADERS = ('Content-Type', 'Vary', 'Allow')
+SKIPPED_META = ('CONTENT_LENGTH', 'CONTENT_TYPE', 'QUERY_STRING', 'PATH_INFO', 'REQUEST_METHOD')
+
+
+class SubRequestSerializer(serializers.Serializer):
+    """A single request of a batch."""
+    method = serializers.ChoiceField(choices=['GET'], default='GET')
+    url = serializers.CharField()
+
+
+class BatchSerializer(serializers.Serializer):
+    """Batch request body."""
+    requests = SubRequestSerializer(many=True, min_length=1, max_length=BATCH_MAX_REQUESTS)
+    atomic = serializers.BooleanField(default=False)
+
+
+@contextmanager
+def read_snapshot():
+    """
+    Run the enclosed queries in one read-only transaction, so all
+    sub-requests see the same database state.
+    """
+    outermost = not connection.in_atomic_block
+    with transaction.atomic():
+        if outermost and connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY')
+        yield
+
+
+def _sub_request(request, url, match):
+    """Build a GET request for `url` that shares the outer request's auth."""
+    outer = request._request
+    parts = urlsplit(url)
+    sub = HttpRequest()
+    sub.META = {key: value for key, value in outer.META.items() if key not in SKIPPED_META}
+    sub.method = sub.META['REQUEST_METHOD'] = 'GET'
+    sub.path = sub.path_info = sub.META['PATH_INFO'] = parts.path
+    sub.META['QUERY_STRING'] = parts.query
+    sub.GET = QueryDict(parts.query)
+    sub.COOKIES = outer.COOKIES
+    sub.resolver_match = match
+    sub.batch_credentials = (request.user, request.auth)
+    return sub
+
+
+def _response_body(response):
+    """Return the data of a sub-response, decoding plain JSON responses."""
+    if hasattr(response, 'data'):
+        return response.data
+    if response.get('Content-Type', '').startswith('application/json'):
+        return json.loads(response.content)
+    return response.content.decode(errors='replace')
+
+
+def _dispatch(request, url):
+    """Resolve and run one sub-request; return its status, headers and body."""
+    try:
+        match = resolve(urlsplit(url).path)
+    except Resolver404:
+        return {'status': 404, 'headers': {}, 'body': {'detail': 'Not found.'}}
+    if match.func is batch_view:
+        return {'status': 400, 'headers': {}, 'body': {'detail': 'Batches cannot be nested.'}}
+    view = getattr(match.func, 'sync_view', match.func)
+    if not hasattr(view, 'cls'):
+        return {'status': 400, 'headers': {}, 'body': {'detail': 'Only API endpoints can be batched.'}}
+    response = view(_sub_request(request, url, match), *match.args, **match.kwargs)
+    headers = {key: value for key, value in response.items() if key not in DROPPED_HEADERS}
+    return {'status': response.status_code, 'headers': headers, 'body': _response_body(response)}
+
+
+@api_view(['POST'])
+@throttle_classes([])
+def batch_view(request):
+    """
+    Run several GET requests against API endpoints in one round trip.
+    Each sub-request runs as the batch's user and is throttled like a
+    regular request.
+
+    POST /api/batch/
+    {
+        "requests": [{"url": "/api/auth/me/"}, {"url": "/api/tasks/"}],
+        "atomic": true
+    }
+    """
+    serializer = BatchSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=400)
+    urls = [item['url'] for item in serializer.validated_data['requests']]
+    with read_snapshot() if serializer.validated_data['atomic'] else nullcontext():
+        responses = [_dispatch(request, url) for url in urls]
+    return Response({'responses': responses})
@@ -0,0 +1,117 @@
+"""
+In-process ASGI load test for the read endpoints.
+
+Run it once with ASYNC_READ_VIEWS=False and once with ASYNC_READ_VIEWS=True
+to compare the sync DRF views with the native async views per worker.
+The response cache is switched off for the run, so every request reaches
+the ORM instead of being answered from the cache, and so are the throttles,
+so no request is answered with 429.
+"""
+import asyncio
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+from rest_framework.authtoken.models import Token
+
+from core.asgi import application
+
+
+def _build_scope(path, token_key):
+    """Build a minimal ASGI HTTP scope for an authenticated GET request."""
+    path, _, query = path.partition('?')
+    return {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'query_string': query.encode(),
+        'root_path': '',
+        'headers': [
+            (b'host', b'localhost'),
+            (b'authorization', f'Token {token_key}'.encode()),
+        ],
+        'client': ('127.0.0.1', 50000),
+        'server': ('localhost', 80),
+    }
+
+
+async def _request(scope):
+    """Send one request through the ASGI app and return its status code."""
+    sent = {'body': False}
+    result = {}
+
+    async def receive():
+        if sent['body']:
+            await asyncio.Event().wait()
+        sent['body'] = True
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        if message['type'] == 'http.response.start':
+            result['status'] = message['status']
+
+    await application(scope, receive, send)
+    return result.get('status')
+
+
+class Command(BaseCommand):
+    """Measure throughput and latency of a read endpoint under concurrency."""
+    help = 'Load test a read endpoint through the ASGI application in-process.'
+
+    def add_arguments(self, parser):
+        """Register command line options."""
+        parser.add_argument('--email', required=True, help='User whose token is used')
+        parser.add_argument('--path', default='/api/tasks/')
+        parser.add_argument('--concurrency', type=int, default=50)
+        parser.add_argument('--requests', type=int, default=500)
+
+    async def _worker(self, scope, count, latencies, statuses):
+        """Issue `count` sequential requests and record their latencies."""
+        for _ in range(count):
+            start = time.perf_counter()
+            statuses.append(await _request(scope))
+            latencies.append(time.perf_counter() - start)
+
+    async def _run(self, scope, concurrency, total):
+        """Run all workers concurrently and return the collected samples."""
+        latencies, statuses = [], []
+        per_worker = max(total // concurrency, 1)
+        await asyncio.gather(*(
+            self._worker(scope, per_worker, latencies, statuses)
+            for _ in range(concurrency)
+        ))
+        return latencies, statuses
+
+    def _token_key(self, email):
+        """Look up the auth token of the given user."""
+        token = Token.objects.filter(user__email=email).first()
+        if token is None:
+            raise CommandError(f'No token for {email}; log in once first.')
+        return token.key
+
+    def handle(self, *args, **options):
+        """Run the load test and print a summary."""
+        scope = _build_scope(options['path'], self._token_key(options['email']))
+        caches = {**settings.CACHES, settings.RESPONSE_CACHE_ALIAS: settings.RESPONSE_CACHE_BACKENDS['dummy']}
+        with override_settings(CACHES=caches, THROTTLE_ENABLED=False):
+            start = time.perf_counter()
+            latencies, statuses = asyncio.run(
+                self._run(scope, options['concurrency'], options['requests'])
+            )
+            elapsed = time.perf_counter() - start
+        self._report(latencies, statuses, elapsed)
+
+    def _report(self, latencies, statuses, elapsed):
+        """Print throughput and latency percentiles."""
+        quantiles = statistics.quantiles(latencies, n=100)
+        mode = 'async' if settings.ASYNC_READ_VIEWS else 'sync'
+        errors = sum(1 for status in statuses if status != 200)
+        self.stdout.write(f'mode: {mode} views, {len(latencies)} requests, {errors} errors')
+        self.stdout.write(f'throughput: {len(latencies) / elapsed:.1f} req/s')
+        self.stdout.write(f'latency p50: {quantiles[49] * 1000:.1f} ms, p95: {quantiles[94] * 1000:.1f} ms')
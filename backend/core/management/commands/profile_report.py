@@ -0,0 +1,50 @@
+"""
+Aggregate request profiles into a per-view hotspot report.
+"""
+from collections import Counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.profiling import hotspots, read_profiles
+
+
+class Command(BaseCommand):
+    """Summarize the profiles written by ProfilingMiddleware per view."""
+    help = 'Show the functions where profiled requests spend their time, per view.'
+
+    def add_arguments(self, parser):
+        """Register command line options."""
+        parser.add_argument('--dir', default=None, help='Override PROFILING_DIR')
+        parser.add_argument('--view', default=None, help='Only this view, e.g. TaskViewSet.list')
+        parser.add_argument('--top', type=int, default=10, help='Functions per view')
+        parser.add_argument('--flamegraph', default=None, help='Write merged collapsed stacks of --view here')
+
+    def handle(self, *args, **options):
+        """Print the hotspot table of every view, busiest view first."""
+        profiles = read_profiles(options['dir'] or settings.PROFILING_DIR)
+        if options['view']:
+            profiles = {v: p for v, p in profiles.items() if v == options['view']}
+        if not profiles:
+            self.stdout.write('no profiles found')
+            return
+        ranked = sorted(profiles.items(), key=lambda item: -sum(item[1][1].values()))
+        for view, (files, counts) in ranked:
+            self._report(view, files, counts, options['top'])
+        if options['flamegraph']:
+            self._write_flamegraph(options['flamegraph'], profiles)
+
+    def _report(self, view, files, counts, top):
+        """Print the hotspots of one view."""
+        samples = sum(counts.values())
+        self.stdout.write(self.style.MIGRATE_HEADING(f'{view}: {files} profiles, {samples} samples'))
+        self.stdout.write(f'{"self %":>7} {"total %":>8}  function')
+        for name, own, total in hotspots(counts, top):
+            self.stdout.write(f'{own / samples:>7.1%} {total / samples:>8.1%}  {name}')
+
+    def _write_flamegraph(self, path, profiles):
+        """Write the merged collapsed stacks of the selected views."""
+        merged = sum((counts for _, counts in profiles.values()), Counter())
+        with open(path, 'w') as output:
+            output.writelines(f'{stack} {count}\n' for stack, count in merged.most_common())
+        self.stdout.write(self.style.SUCCESS(f'collapsed stacks written to {path}'))
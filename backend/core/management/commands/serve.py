@@ -0,0 +1,111 @@
+"""
+Production server entry point: preload and warm up, then fork workers.
+"""
+import time
+
+from django.conf import settings
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand, CommandError
+from django.core.wsgi import get_wsgi_application
+from django.db import connections
+
+from core.warmup import default_workers, keeps_connections, process_age, warm_database, warm_up
+
+ASGI_WORKER = 'uvicorn.workers.UvicornWorker'
+
+
+def _gunicorn_application(application, config):
+    """Wrap an already loaded application in a gunicorn application."""
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        raise CommandError('gunicorn is not installed (pip install gunicorn).')
+
+    class PreloadedApplication(BaseApplication):
+        def load_config(self):
+            for key, value in config.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return application
+
+    return PreloadedApplication()
+
+
+def _post_fork(server, worker):
+    """
+    Open the database connection of a new worker before it accepts requests.
+    Skipped with CONN_MAX_AGE = 0, where Django closes it when the first
+    request starts.
+    """
+    if not keeps_connections():
+        return
+    start = time.perf_counter()
+    warm_database()
+    server.log.info('worker %s: database ready in %.1f ms', worker.pid, (time.perf_counter() - start) * 1000)
+
+
+class Command(BaseCommand):
+    """Warm up the app once in the master process and serve it with gunicorn."""
+    help = 'Preload and warm up the app, then serve it with CPU-sized gunicorn workers.'
+
+    def add_arguments(self, parser):
+        """Register command line options."""
+        parser.add_argument('--bind', default=settings.SERVE_BIND)
+        parser.add_argument('--workers', type=int, default=settings.SERVE_WORKERS, help='0 = 2 x CPUs + 1')
+        parser.add_argument('--timeout', type=int, default=30)
+        parser.add_argument('--asgi', action='store_true', help='Serve core.asgi with uvicorn workers')
+        parser.add_argument('--check', action='store_true', help='Only warm up, report and exit')
+        parser.add_argument('--max-startup-ms', type=float, default=settings.SERVE_STARTUP_BUDGET_MS)
+
+    def handle(self, *args, **options):
+        """Warm up, report the startup time and start the workers."""
+        started = time.perf_counter() - process_age()
+        timings = {'process_setup': (time.perf_counter() - started) * 1000}
+        application = get_wsgi_application()
+        timings.update(warm_up(application))
+        startup_ms = (time.perf_counter() - started) * 1000
+        within_budget = self._report(timings, startup_ms, options['max_startup_ms'])
+        if options['check']:
+            if not within_budget:
+                raise CommandError('startup exceeded --max-startup-ms')
+            return
+        connections.close_all()
+        self._serve(get_asgi_application() if options['asgi'] else application, options, started)
+
+    def _report(self, timings, startup_ms, budget_ms):
+        """Print the warm-up timings; return False if over the budget."""
+        for step, ms in timings.items():
+            self.stdout.write(f'  {step:<16} {ms:8.1f} ms')
+        self.stdout.write(f'  {"startup total":<16} {startup_ms:8.1f} ms')
+        if budget_ms and startup_ms > budget_ms:
+            self.stderr.write(self.style.WARNING(f'startup took longer than {budget_ms:.0f} ms'))
+            return False
+        return True
+
+    def _warn_process_local_cache(self, workers):
+        """Warn if several workers would each keep their own response cache."""
+        backend = settings.CACHES[settings.RESPONSE_CACHE_ALIAS]['BACKEND']
+        if workers > 1 and backend.endswith('LocMemCache'):
+            self.stderr.write(self.style.WARNING(
+                f'RESPONSE_CACHE_BACKEND=locmem is per process: {workers} workers would serve stale '
+                'lists after writes handled by another worker. Use `file`, a shared backend or `dummy`.'
+            ))
+
+    def _serve(self, application, options, started):
+        """Fork the configured number of workers from this warm process."""
+        workers = options['workers'] or default_workers()
+        self._warn_process_local_cache(workers)
+        config = {
+            'bind': options['bind'],
+            'workers': workers,
+            'timeout': options['timeout'],
+            'preload_app': True,
+            'post_fork': _post_fork,
+            'when_ready': lambda server: server.log.info(
+                'listening %.0f ms after start, forking %d workers', (time.perf_counter() - started) * 1000, workers
+            ),
+        }
+        if options['asgi']:
+            config['worker_class'] = ASGI_WORKER
+        _gunicorn_application(application, config).run()
@@ -0,0 +1,56 @@
+"""
+Measure the per-request overhead of the token-bucket throttles.
+"""
+import tempfile
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+from django.test.utils import override_settings
+
+from core.throttling import ReadThrottle
+
+
+class Command(BaseCommand):
+    """Time ReadThrottle.allow_request for each bucket backend."""
+    help = 'Report the overhead of the API throttles per request.'
+
+    def add_arguments(self, parser):
+        """Register command line options."""
+        parser.add_argument('--iterations', type=int, default=100000)
+        parser.add_argument('--clients', type=int, default=1000, help='Distinct client IPs')
+
+    def _requests(self, clients):
+        """Build anonymous GET requests from distinct client addresses."""
+        factory = RequestFactory()
+        requests = []
+        for index in range(clients):
+            request = factory.get('/api/tasks/', REMOTE_ADDR=f'10.0.{index // 256}.{index % 256}')
+            request.user = AnonymousUser()
+            requests.append(request)
+        return requests
+
+    def _measure(self, requests, iterations):
+        """Return the mean time per allow_request call in microseconds."""
+        throttle = ReadThrottle()
+        throttle.num_requests, throttle.duration = 10 ** 9, 1
+        start = time.perf_counter()
+        for index in range(iterations):
+            throttle.allow_request(requests[index % len(requests)], None)
+        return (time.perf_counter() - start) / iterations * 1e6
+
+    def handle(self, *args, **options):
+        """
+        Run the benchmark for the local and the cache backend; the file
+        cache is measured in a temporary directory, not the live buckets.
+        """
+        requests = self._requests(options['clients'])
+        with tempfile.TemporaryDirectory() as directory:
+            throttle_cache = {**settings.CACHES[settings.THROTTLE_CACHE_ALIAS], 'LOCATION': directory}
+            for backend in ('local', 'cache'):
+                caches = {**settings.CACHES, settings.THROTTLE_CACHE_ALIAS: throttle_cache}
+                with override_settings(THROTTLE_BACKEND=backend, CACHES=caches):
+                    micros = self._measure(requests, options['iterations'])
+                self.stdout.write(f'{backend:>5}: {micros:.2f} µs per request')
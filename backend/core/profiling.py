@@ -0,0 +1,155 @@
+"""
+On-demand sampling profiler for single requests.
+
+A request is profiled when a staff user sends `X-Profile: 1`, or when it
+is picked by PROFILING_SAMPLE_RATE. While the view runs, a helper thread
+records the request thread's call stack every PROFILING_INTERVAL seconds.
+The samples are written as collapsed stacks (one `a;b;c count` line per
+distinct stack, the input format of flamegraph.pl and speedscope) to
+PROFILING_DIR, one file per request named after the view. Without
+PROFILING_ENABLED the middleware removes itself from the chain.
+"""
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from rest_framework.authtoken.models import Token
+
+PROFILE_HEADER = 'X-Profile'
+PROFILE_SUFFIX = '.collapsed'
+
+
+def _frame_name(frame):
+    """Return `module:function` for a frame."""
+    return f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_name}"
+
+
+def collapse_stack(frame, stop_code=None):
+    """Return the stack of `frame` as `root;...;leaf`, cut below `stop_code`."""
+    names = []
+    while frame is not None and frame.f_code is not stop_code:
+        names.append(_frame_name(frame))
+        frame = frame.f_back
+    return ';'.join(reversed(names))
+
+
+class StackSampler:
+    """Context manager sampling the call stack of one thread."""
+
+    def __init__(self, thread_id, interval, stop_code=None):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stop_code = stop_code
+        self.counts = Counter()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        """Record one sample per interval until stopped."""
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None and not self._stopped.is_set():
+                self.counts[collapse_stack(frame, self.stop_code)] += 1
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stopped.set()
+        self._thread.join()
+
+
+def view_name(request):
+    """Name the resolved view, e.g. `TaskViewSet.list` or `register_view`."""
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return 'unresolved'
+    view_class = getattr(match.func, 'cls', None)
+    if view_class is None:
+        return match.func.__name__
+    actions = getattr(match.func, 'actions', None) or {}
+    action = actions.get(request.method.lower())
+    return f'{view_class.__name__}.{action}' if action else view_class.__name__
+
+
+def write_profile(directory, name, counts):
+    """Write collapsed stacks to a new file tagged with the view name."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f'{name}.{time.time_ns()}.{os.getpid()}{PROFILE_SUFFIX}'
+    lines = [f'{stack} {count}\n' for stack, count in counts.most_common()]
+    path.write_text(''.join(lines))
+    return path
+
+
+def _is_staff(request):
+    """Check the session user or the token in `Authorization` for staff."""
+    if request.user.is_authenticated:
+        return request.user.is_staff
+    parts = request.headers.get('Authorization', '').split()
+    if len(parts) != 2 or parts[0].lower() != 'token':
+        return False
+    return Token.objects.filter(key=parts[1], user__is_staff=True, user__is_active=True).exists()
+
+
+class ProfilingMiddleware:
+    """
+    Profile selected requests with StackSampler. Profiled responses carry
+    the written file name in the `X-Profile` header.
+    """
+
+    def __init__(self, get_response):
+        if not settings.PROFILING_ENABLED:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+
+    def _wants_profile(self, request):
+        """Pick the request by header (staff only) or by sampling rate."""
+        if request.headers.get(PROFILE_HEADER) == '1' and _is_staff(request):
+            return True
+        return random.random() < settings.PROFILING_SAMPLE_RATE
+
+    def __call__(self, request):
+        if not self._wants_profile(request):
+            return self.get_response(request)
+        sampler = StackSampler(threading.get_ident(), settings.PROFILING_INTERVAL, self.__call__.__code__)
+        with sampler:
+            response = self.get_response(request)
+        if sampler.counts:
+            path = write_profile(settings.PROFILING_DIR, view_name(request), sampler.counts)
+            response[PROFILE_HEADER] = path.name
+        return response
+
+
+def read_profiles(directory):
+    """Merge the profile files in `directory` into {view: (files, Counter)}."""
+    profiles = {}
+    for path in sorted(Path(directory).glob(f'*{PROFILE_SUFFIX}')):
+        view = path.name.rsplit('.', 3)[0]
+        files, counts = profiles.get(view, (0, Counter()))
+        for line in path.read_text().splitlines():
+            stack, _, count = line.rpartition(' ')
+            counts[stack] += int(count)
+        profiles[view] = (files + 1, counts)
+    return profiles
+
+
+def hotspots(counts, top=10):
+    """
+    Rank functions by self samples (leaf of the stack) and return
+    (function, self samples, total samples) for the `top` functions.
+    """
+    own, total = Counter(), Counter()
+    for stack, count in counts.items():
+        frames = stack.split(';')
+        own[frames[-1]] += count
+        for name in set(frames):
+            total[name] += count
+    return [(name, samples, total[name]) for name, samples in own.most_common(top)]
@@ -0,0 +1,163 @@
+"""
+Shared server-side cache for list and retrieve responses.
+
+Boards and contacts are shared between all users, so a response only
+depends on the requested resource and its query parameters. Every cache
+key embeds a per-namespace generation number; model signals bump the
+generation after a write commits, which makes all older entries of that
+namespace unreachable without having to enumerate them.
+
+Hit and miss counters are kept in the memory of each serving process
+and exposed by that process at `GET /api/response-cache/stats/`.
+"""
+import hashlib
+import os
+import threading
+import time
+from collections import Counter
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.http import HttpRequest
+from rest_framework import permissions
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+_counters = Counter()
+_counters_lock = threading.Lock()
+
+
+def _cache():
+    """Return the cache backend configured for responses."""
+    return caches[settings.RESPONSE_CACHE_ALIAS]
+
+
+def _incr(key):
+    """Increment a counter, creating it on first use."""
+    cache = _cache()
+    if cache.add(key, 1, timeout=None):
+        return
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, timeout=None)
+
+
+def generation(namespace):
+    """
+    Return the current generation of a namespace.
+    Starts from a timestamp so a cleared cache never revives old keys.
+    """
+    key = f'response-cache:gen:{namespace}'
+    cache = _cache()
+    cache.add(key, time.time_ns(), timeout=None)
+    return cache.get(key)
+
+
+def _bump_now(namespaces):
+    """Advance the generation of every given namespace."""
+    for namespace in namespaces:
+        _incr(f'response-cache:gen:{namespace}')
+
+
+def bump_generation(*namespaces):
+    """Invalidate all cached responses of the namespaces after commit."""
+    transaction.on_commit(lambda: _bump_now(namespaces))
+
+
+def build_key(namespace, action, params, pk=None):
+    """Build the cache key of a response from its query parameters."""
+    query = urlencode(sorted(params.lists()), doseq=True)
+    digest = hashlib.md5(query.encode()).hexdigest()
+    return f'response-cache:{namespace}:{generation(namespace)}:{action}:{pk or ""}:{digest}'
+
+
+def lookup(key):
+    """Return cached response data or None, recording a hit or miss."""
+    data = _cache().get(key)
+    with _counters_lock:
+        _counters['hits' if data is not None else 'misses'] += 1
+    return data
+
+
+def store(key, data):
+    """Store response data under the given key."""
+    _cache().set(key, data, timeout=settings.RESPONSE_CACHE_TIMEOUT)
+
+
+def warm_list(viewset_class, board):
+    """
+    Compute and store the unfiltered list response of a board-scoped
+    viewset, so the first read after a write is a cache hit.
+    """
+    view = viewset_class(action='list', kwargs={}, format_kwarg=None)
+    view.request = Request(HttpRequest())
+    view.board = board
+    queryset = view.filter_queryset(view.get_queryset())
+    data = view.get_serializer(queryset, many=True).data
+    store(build_key(view.get_cache_namespace(), 'list', view.request.query_params), data)
+
+
+def get_stats():
+    """Return this process's hit and miss counters with the resulting hit ratio."""
+    with _counters_lock:
+        hits, misses = _counters['hits'], _counters['misses']
+    total = hits + misses
+    return {'pid': os.getpid(), 'hits': hits, 'misses': misses, 'hit_ratio': hits / total if total else 0.0}
+
+
+def reset_stats():
+    """Reset this process's hit and miss counters."""
+    with _counters_lock:
+        _counters.clear()
+
+
+@api_view(['GET', 'DELETE'])
+@permission_classes([permissions.IsAdminUser])
+def stats_view(request):
+    """
+    Show (GET) or reset (DELETE) the counters of the worker process that
+    answers the request. Staff only.
+
+    GET /api/response-cache/stats/
+    """
+    if request.method == 'DELETE':
+        reset_stats()
+    return Response(get_stats())
+
+
+class CachedResponseMixin:
+    """
+    ViewSet mixin that serves `list` and `retrieve` from the response cache.
+    Adds an `X-Cache: HIT|MISS` header to every cacheable response.
+    """
+    cache_namespace = None
+
+    def get_cache_namespace(self):
+        """Return the namespace whose generation guards this view's entries."""
+        return self.cache_namespace
+
+    def _cached_response(self, handler, request, *args, **kwargs):
+        """Return the cached response or compute and store it."""
+        key = build_key(self.get_cache_namespace(), self.action, request.query_params, kwargs.get('pk'))
+        data = lookup(key)
+        if data is not None:
+            response = Response(data)
+            response['X-Cache'] = 'HIT'
+            return response
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            store(key, response.data)
+        response['X-Cache'] = 'MISS'
+        return response
+
+    def list(self, request, *args, **kwargs):
+        """List objects through the response cache."""
+        return self._cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        """Retrieve an object through the response cache."""
+        return self._cached_response(super().retrieve, request, *args, **kwargs)
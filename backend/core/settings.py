@@ -32,9 +32,13 @@ INSTALLED_APPS = [
     'rest_framework.authtoken',
     'corsheaders',
     'django_filters',
+    'core',
     'users',
+    'boards',
     'contacts',
     'tasks',
+    'jobs',
+    'activity',
 ]
 
 MIDDLEWARE = [
@@ -44,6 +48,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.profiling.ProfilingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -71,9 +76,61 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Keep connections open between requests (seconds; 0 closes after each request)
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=0, cast=int),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
+RESPONSE_CACHE_BACKENDS = {
+    'locmem': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'join-responses',
+    },
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / '.cache' / 'responses',
+    },
+    'dummy': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    },
+}
+
+# Shared token buckets for THROTTLE_BACKEND=cache: a redis:// URL (atomic,
+# needs `pip install redis`) or a directory for a file cache on one host
+THROTTLE_CACHE_LOCATION = config('THROTTLE_CACHE_LOCATION', default=str(BASE_DIR / '.cache' / 'throttle'))
+
+THROTTLE_CACHE_BACKENDS = {
+    'redis': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': THROTTLE_CACHE_LOCATION,
+    },
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': THROTTLE_CACHE_LOCATION,
+        # Culling deletes random entries, refilling those buckets: keep one per client
+        'OPTIONS': {'MAX_ENTRIES': config('THROTTLE_CACHE_MAX_ENTRIES', default=10000, cast=int)},
+    },
+}
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'responses': RESPONSE_CACHE_BACKENDS[config('RESPONSE_CACHE_BACKEND', default='dummy')],
+    'throttle': THROTTLE_CACHE_BACKENDS[
+        'redis' if THROTTLE_CACHE_LOCATION.startswith(('redis://', 'rediss://')) else 'file'
+    ],
+}
+
+RESPONSE_CACHE_ALIAS = 'responses'
+
+RESPONSE_CACHE_TIMEOUT = config('RESPONSE_CACHE_TIMEOUT', default=300, cast=int)
+
+# Refill task/contact list caches via background jobs after writes
+# (the worker must share the cache, e.g. RESPONSE_CACHE_BACKEND=file)
+RESPONSE_CACHE_WARM = config('RESPONSE_CACHE_WARM', default=False, cast=bool)
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -105,6 +162,7 @@ AUTH_USER_MODEL = 'users.User'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
+        'core.authentication.BatchSubRequestAuthentication',
         'rest_framework.authentication.TokenAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
@@ -112,8 +170,58 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_PAGINATION_CLASS': None,
+    'DEFAULT_THROTTLE_CLASSES': [
+        'core.throttling.ReadThrottle',
+        'core.throttling.WriteThrottle',
+    ],
+    'DEFAULT_THROTTLE_RATES': {
+        'read': config('THROTTLE_RATE_READ', default='600/min'),
+        'write': config('THROTTLE_RATE_WRITE', default='120/min'),
+        'auth': config('THROTTLE_RATE_AUTH', default='10/min'),
+    },
+    # Trusted reverse proxies in front of the app; 0 ignores X-Forwarded-For
+    'NUM_PROXIES': config('NUM_PROXIES', default=0, cast=int),
 }
 
+# Token buckets in process memory ('local') or in a shared cache ('cache')
+THROTTLE_BACKEND = config('THROTTLE_BACKEND', default='local')
+
+# Switch the API throttles off entirely (load tests)
+THROTTLE_ENABLED = config('THROTTLE_ENABLED', default=True, cast=bool)
+
+THROTTLE_CACHE_ALIAS = 'throttle'
+
+# Done tasks unchanged for this many days are moved by `manage.py archive_tasks`
+TASK_ARCHIVE_AFTER_DAYS = config('TASK_ARCHIVE_AFTER_DAYS', default=30, cast=int)
+
+# Serve task lists, filters and the summary from an in-process copy of each
+# board, revalidated against the board's task generation in the database
+TASK_READ_MODEL = config('TASK_READ_MODEL', default=False, cast=bool)
+
+# Run background jobs in-process after commit; set False once `manage.py run_jobs` runs
+JOBS_EAGER = config('JOBS_EAGER', default=True, cast=bool)
+
+# Activity log entries are inserted in batches of this size, or this many
+# seconds after the first buffered entry (1 = write every entry immediately)
+ACTIVITY_BUFFER_SIZE = config('ACTIVITY_BUFFER_SIZE', default=50, cast=int)
+ACTIVITY_FLUSH_INTERVAL = config('ACTIVITY_FLUSH_INTERVAL', default=2.0, cast=float)
+
+# `manage.py serve`: bind address, worker count (0 = 2 x CPUs + 1) and the
+# startup time above which a warning is printed (`serve --check` fails)
+SERVE_BIND = config('SERVE_BIND', default='0.0.0.0:8000')
+SERVE_WORKERS = config('SERVE_WORKERS', default=0, cast=int)
+SERVE_STARTUP_BUDGET_MS = config('SERVE_STARTUP_BUDGET_MS', default=3000, cast=float)
+
+# Request profiling: staff send `X-Profile: 1`, or a share of requests is sampled.
+# When disabled the middleware drops out of the chain entirely.
+PROFILING_ENABLED = config('PROFILING_ENABLED', default=False, cast=bool)
+PROFILING_SAMPLE_RATE = config('PROFILING_SAMPLE_RATE', default=0.0, cast=float)
+PROFILING_INTERVAL = config('PROFILING_INTERVAL', default=0.005, cast=float)
+PROFILING_DIR = config('PROFILING_DIR', default=str(BASE_DIR / '.cache' / 'profiles'))
+
+# Serve task, contact and current-user reads from native async views (ASGI only)
+ASYNC_READ_VIEWS = config('ASYNC_READ_VIEWS', default=False, cast=bool)
+
 CORS_ALLOWED_ORIGINS = config(
     'CORS_ALLOWED_ORIGINS',
     default='http://localhost:4200,http://127.0.0.1:4200',
@@ -0,0 +1,141 @@
+"""
+Token-bucket throttles for the API.
+
+Each client (authenticated user, otherwise IP address) gets one bucket
+per scope. The IP address is REMOTE_ADDR, or the address NUM_PROXIES hops
+back in X-Forwarded-For behind trusted proxies. A bucket holds up to `num_requests` tokens and refills at
+`num_requests / duration` tokens per second, so short bursts are allowed
+while the long-term rate stays bounded. Buckets live in process memory by
+default; set THROTTLE_BACKEND = 'cache' to share them between workers
+through the 'throttle' cache (Redis, or a file cache on a single host).
+"""
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.throttling import SimpleRateThrottle
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+def _refill(tokens, stamp, now, capacity, refill_rate):
+    """Return the token count after refilling since `stamp`."""
+    return min(capacity, tokens + (now - stamp) * refill_rate)
+
+
+def _take(tokens, refill_rate):
+    """Take one token; return (allowed, remaining tokens, seconds to wait)."""
+    if tokens >= 1:
+        return True, tokens - 1, 0.0
+    return False, tokens, (1 - tokens) / refill_rate
+
+
+class LocalBucketStore:
+    """
+    Buckets in a dict guarded by a lock; state is per worker process.
+    Beyond `max_buckets` the least recently used bucket is evicted.
+    """
+    max_buckets = 10000
+
+    def __init__(self):
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def consume(self, key, capacity, refill_rate):
+        """Take a token from the bucket; return (allowed, wait seconds)."""
+        now = time.monotonic()
+        with self._lock:
+            tokens, stamp = self._buckets.pop(key, (capacity, now))
+            tokens = _refill(tokens, stamp, now, capacity, refill_rate)
+            allowed, tokens, wait = _take(tokens, refill_rate)
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self.max_buckets:
+                del self._buckets[next(iter(self._buckets))]
+        return allowed, wait
+
+
+class CacheBucketStore:
+    """
+    Buckets in a Django cache shared by all workers. Read-modify-write is
+    not atomic, so concurrent requests of one client may overshoot slightly.
+    The file cache lists its directory on every write, so its cost grows
+    with the number of clients; use Redis for many clients or several hosts.
+    """
+
+    def __init__(self, alias):
+        self.cache = caches[alias]
+
+    def consume(self, key, capacity, refill_rate):
+        """Take a token from the bucket; return (allowed, wait seconds)."""
+        now = time.time()
+        tokens, stamp = self.cache.get(key, (capacity, now))
+        tokens = _refill(tokens, stamp, now, capacity, refill_rate)
+        allowed, tokens, wait = _take(tokens, refill_rate)
+        timeout = int(capacity / refill_rate) + 1
+        self.cache.set(key, (tokens, now), timeout=timeout)
+        return allowed, wait
+
+
+_local_store = LocalBucketStore()
+
+
+def get_bucket_store():
+    """Return the bucket store selected by THROTTLE_BACKEND."""
+    if settings.THROTTLE_BACKEND == 'cache':
+        return CacheBucketStore(settings.THROTTLE_CACHE_ALIAS)
+    return _local_store
+
+
+class TokenBucketThrottle(SimpleRateThrottle):
+    """
+    Base class for token-bucket throttles.
+    Subclasses set `scope` and optionally restrict `methods`.
+    """
+    methods = None
+    wait_seconds = None
+
+    def get_cache_key(self, request, view):
+        """Identify the client by user id, or by IP for anonymous requests."""
+        if self.methods is not None and request.method not in self.methods:
+            return None
+        user = getattr(request, 'user', None)
+        if user is not None and user.is_authenticated:
+            return f'throttle:{self.scope}:user:{user.pk}'
+        return f'throttle:{self.scope}:ip:{self.get_ident(request)}'
+
+    def allow_request(self, request, view):
+        """Take a token from the client's bucket."""
+        if self.rate is None or not settings.THROTTLE_ENABLED:
+            return True
+        key = self.get_cache_key(request, view)
+        if key is None:
+            return True
+        refill_rate = self.num_requests / self.duration
+        allowed, self.wait_seconds = get_bucket_store().consume(key, self.num_requests, refill_rate)
+        return allowed
+
+    def wait(self):
+        """Seconds until the next token is available (used for Retry-After)."""
+        return self.wait_seconds
+
+
+class ReadThrottle(TokenBucketThrottle):
+    """Budget for safe (read) requests."""
+    scope = 'read'
+    methods = SAFE_METHODS
+
+
+class WriteThrottle(TokenBucketThrottle):
+    """Budget for requests that modify data."""
+    scope = 'write'
+    methods = ('POST', 'PUT', 'PATCH', 'DELETE')
+
+
+class AuthThrottle(TokenBucketThrottle):
+    """Budget for the password-hashing login and registration views, per IP."""
+    scope = 'auth'
+
+    def get_cache_key(self, request, view):
+        """Always throttle by IP, since these requests are anonymous."""
+        return f'throttle:{self.scope}:ip:{self.get_ident(request)}'
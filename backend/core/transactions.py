@@ -0,0 +1,59 @@
+"""
+On-commit callbacks that run once per transaction.
+
+Model signals often fire many times within one transaction (e.g. for every
+subtask of a task). `on_commit_once` registers a single callback per key
+and collects the items of all calls for it. Pending callbacks are tracked
+in a weak, per-thread registry: once Django runs or discards a callback
+(commit or rollback), its entry disappears with it.
+"""
+import threading
+import weakref
+
+from django.db import transaction
+
+_state = threading.local()
+
+
+class _OnCommit:
+    """Callback registered once per key, collecting items until it runs."""
+    __slots__ = ('key', 'func', 'items', '__weakref__')
+
+    def __init__(self, key, func):
+        self.key = key
+        self.func = func
+        self.items = set()
+
+    def __call__(self):
+        if _pending().get(self.key) is self:
+            del _pending()[self.key]
+        self.func(self.items)
+
+
+def _pending():
+    """Return this thread's registry of pending callbacks by key."""
+    if not hasattr(_state, 'callbacks'):
+        _state.callbacks = weakref.WeakValueDictionary()
+    return _state.callbacks
+
+
+def is_pending(key):
+    """Whether a callback for `key` waits for the current transaction."""
+    return key in _pending()
+
+
+def on_commit_once(key, func, items=()):
+    """
+    Call `func(items)` once the current transaction commits, however often
+    this is called with the same `key`; the `items` of all calls are
+    collected into one set, and `func` of later calls is ignored. Outside a
+    transaction `func` runs immediately.
+    """
+    callback = _pending().get(key)
+    if callback is not None:
+        callback.items.update(items)
+        return
+    callback = _OnCommit(key, func)
+    callback.items.update(items)
+    _pending()[key] = callback
+    transaction.on_commit(callback)
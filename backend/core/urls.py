@@ -16,10 +16,16 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
+from core.batch import batch_view
+from core.response_cache import stats_view
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/auth/', include('users.api.urls')),
+    path('api/batch/', batch_view, name='batch'),
+    path('api/response-cache/stats/', stats_view, name='response-cache-stats'),
+    path('api/', include('boards.api.urls')),
     path('api/', include('contacts.api.urls')),
     path('api/', include('tasks.api.urls')),
+    path('api/', include('activity.api.urls')),
 ]
@@ -0,0 +1,126 @@
+"""
+Process warm-up for production servers.
+
+The first request of a fresh process otherwise pays for compiling the URL
+patterns, building serializer fields, importing lazily loaded DRF
+components and opening the database connection. `warm_up()` does that
+work up front and reports how long each step took, so it can run once in
+the server's master process before workers are forked.
+"""
+import os
+import time
+from wsgiref.util import setup_testing_defaults
+
+from django.conf import settings
+from django.db import connections
+from django.urls import URLPattern, URLResolver, get_resolver
+
+WARMUP_PATH = '/api/tasks/'
+
+
+def process_age():
+    """
+    Return the seconds since this process started, from /proc on Linux;
+    elsewhere since the project package was imported (before app loading).
+    """
+    try:
+        with open('/proc/self/stat') as stat, open('/proc/uptime') as uptime:
+            start_ticks = int(stat.read().rpartition(')')[2].split()[19])
+            return float(uptime.read().split()[0]) - start_ticks / os.sysconf('SC_CLK_TCK')
+    except (OSError, ValueError, IndexError):
+        from core import IMPORTED_AT
+        return time.perf_counter() - IMPORTED_AT
+
+
+def default_workers():
+    """Return 2 x usable CPUs + 1 worker processes (the gunicorn rule of thumb)."""
+    if hasattr(os, 'sched_getaffinity'):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    return cpus * 2 + 1
+
+
+def _walk_patterns(patterns):
+    """Yield every URLPattern below the given patterns."""
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from _walk_patterns(pattern.url_patterns)
+        elif isinstance(pattern, URLPattern):
+            yield pattern
+
+
+def warm_url_conf():
+    """Import the URL conf, compile every pattern and build the reverse map."""
+    resolver = get_resolver()
+    patterns = list(_walk_patterns(resolver.url_patterns))
+    for pattern in patterns:
+        pattern.pattern.regex
+    resolver.reverse_dict
+    return patterns
+
+
+def warm_serializers(patterns):
+    """Build the fields of every serializer used by a routed DRF view."""
+    serializer_classes = {
+        getattr(pattern.callback.cls, 'serializer_class', None)
+        for pattern in patterns if hasattr(pattern.callback, 'cls')
+    }
+    for serializer_class in serializer_classes - {None}:
+        serializer_class().fields
+    return len(serializer_classes - {None})
+
+
+def keeps_connections():
+    """Whether connections outlive a request (CONN_MAX_AGE not 0) on every database."""
+    return all(connection.settings_dict['CONN_MAX_AGE'] != 0 for connection in connections.all())
+
+
+def warm_database():
+    """Open (and verify) a connection to every configured database."""
+    for connection in connections.all():
+        connection.ensure_connection()
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+
+
+def _warmup_host():
+    """Return a host name accepted by ALLOWED_HOSTS."""
+    hosts = [host for host in settings.ALLOWED_HOSTS if host != '*']
+    return hosts[0].lstrip('.') if hosts else 'localhost'
+
+
+def warm_request(application, path=WARMUP_PATH):
+    """
+    Send an anonymous GET through the WSGI application's middleware and
+    DRF stack (rejected with 401, so nothing is read or written) and
+    return its latency in milliseconds.
+    """
+    environ = {'REQUEST_METHOD': 'GET', 'PATH_INFO': path, 'HTTP_HOST': _warmup_host()}
+    setup_testing_defaults(environ)
+    start = time.perf_counter()
+    response = application(environ, lambda status, headers: None)
+    b''.join(response)
+    response.close()
+    return (time.perf_counter() - start) * 1000
+
+
+def _timed(step):
+    """Run a step and return (result, elapsed milliseconds)."""
+    start = time.perf_counter()
+    result = step()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def warm_up(application):
+    """Run all warm-up steps for a WSGI application; return their timings in ms."""
+    patterns, url_ms = _timed(warm_url_conf)
+    _, serializer_ms = _timed(lambda: warm_serializers(patterns))
+    _, database_ms = _timed(warm_database)
+    return {
+        'url_conf': url_ms,
+        'serializers': serializer_ms,
+        'database': database_ms,
+        'first_request': warm_request(application),
+        'second_request': warm_request(application),
+    }
@@ -0,0 +1,22 @@
+from django.contrib import admin
+from django.utils import timezone
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    """
+    Admin interface for queued jobs. Failed jobs can be requeued.
+    """
+    list_display = ['name', 'status', 'attempts', 'run_after', 'updated_at']
+    list_filter = ['status', 'name']
+    search_fields = ['name']
+    readonly_fields = ['name', 'payload', 'attempts', 'last_error', 'created_at', 'updated_at']
+    show_full_result_count = False
+    actions = ['requeue']
+
+    @admin.action(description='Requeue selected jobs')
+    def requeue(self, request, queryset):
+        """Reset the selected jobs so a worker picks them up again."""
+        count = queryset.update(status=Job.QUEUED, attempts=0, run_after=timezone.now())
+        self.message_user(request, f'{count} jobs requeued.')
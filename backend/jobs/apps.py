@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+
+
+class JobsConfig(AppConfig):
+    name = 'jobs'
+
+    def ready(self):
+        """Register the job functions of every app (`<app>/jobs.py`)."""
+        autodiscover_modules('jobs')
@@ -0,0 +1,45 @@
+"""
+Worker that runs queued background jobs.
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from jobs.queue import purge_done, run_pending
+
+PURGE_INTERVAL = 3600
+
+
+class Command(BaseCommand):
+    """Poll the job table and run due jobs until interrupted."""
+    help = 'Run queued background jobs (contact provisioning, cache warming, ...).'
+
+    def add_arguments(self, parser):
+        """Register command line options."""
+        parser.add_argument('--once', action='store_true', help='Exit when the queue is empty')
+        parser.add_argument('--batch-size', type=int, default=100)
+        parser.add_argument('--sleep', type=float, default=1.0, help='Seconds to wait when idle')
+
+    def handle(self, *args, **options):
+        """Run batches of jobs, sleeping while the queue is empty."""
+        last_purge = float('-inf')
+        try:
+            while True:
+                if self._run_batch(options['batch_size']):
+                    continue
+                if time.monotonic() - last_purge > PURGE_INTERVAL:
+                    purge_done()
+                    last_purge = time.monotonic()
+                if options['once']:
+                    return
+                time.sleep(options['sleep'])
+        except KeyboardInterrupt:
+            self.stdout.write('worker stopped')
+
+    def _run_batch(self, batch_size):
+        """Run one batch of jobs; return False when the queue was empty."""
+        succeeded, failed = run_pending(batch_size)
+        if not (succeeded or failed):
+            return False
+        self.stdout.write(f'{succeeded} jobs done, {failed} failed')
+        return True
@@ -0,0 +1,140 @@
+"""
+Lightweight database-backed job queue.
+
+Side effects that a response does not depend on are registered with
+`@job('name')` in an app's `jobs.py` and enqueued with `enqueue()`.
+`manage.py run_jobs` claims and runs them. With JOBS_EAGER = True (the
+default) the jobs run in-process right after the enqueuing transaction
+commits, so setups without a worker still get their side effects; a job
+that fails there is logged and queued for a retry instead of failing the
+request.
+"""
+import logging
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from core.transactions import on_commit_once
+from .models import Job
+
+STALE_AFTER = timedelta(minutes=10)
+RETRY_DELAY = timedelta(seconds=30)
+
+_registry = {}
+
+logger = logging.getLogger(__name__)
+
+
+def job(name):
+    """Register the decorated function as the job called `name`."""
+    def decorator(func):
+        _registry[name] = func
+        func.job_name = name
+        return func
+    return decorator
+
+
+def enqueue(name, unique=False, **payload):
+    """
+    Queue a call of job `name` with the given keyword arguments.
+    With `unique`, nothing is queued while an identical job is waiting.
+    """
+    if name not in _registry:
+        raise KeyError(f'Unknown job: {name}')
+    if settings.JOBS_EAGER:
+        transaction.on_commit(lambda: _run_eager(name, payload))
+        return None
+    if unique and Job.objects.filter(name=name, status=Job.QUEUED, payload=payload).exists():
+        return None
+    return Job.objects.create(name=name, payload=payload)
+
+
+def enqueue_on_commit(name, **payload):
+    """
+    Queue a unique job once the current transaction commits. Repeated
+    calls within one transaction (e.g. from model signals) queue it once.
+    """
+    key = ('job', name, tuple(sorted(payload.items())))
+    on_commit_once(key, lambda items: enqueue(name, unique=True, **payload))
+
+
+def _claimable():
+    """Due queued jobs plus running jobs whose worker has gone away."""
+    now = timezone.now()
+    return Job.objects.filter(
+        Q(status=Job.QUEUED, run_after__lte=now)
+        | Q(status=Job.RUNNING, updated_at__lt=now - STALE_AFTER)
+    ).order_by('run_after', 'id')
+
+
+@transaction.atomic
+def claim(limit):
+    """
+    Mark up to `limit` due jobs as running and return them. Each UPDATE
+    re-checks that the job is still claimable, so without SKIP LOCKED
+    (SQLite) a job another worker claimed in between is left out.
+    """
+    queryset = _claimable()
+    if connection.features.has_select_for_update_skip_locked:
+        queryset = queryset.select_for_update(skip_locked=True)
+    claimed = []
+    for job_row in queryset[:limit]:
+        if _claimable().filter(id=job_row.id).update(
+            status=Job.RUNNING, attempts=F('attempts') + 1, updated_at=timezone.now(),
+        ):
+            claimed.append(job_row)
+    return claimed
+
+
+def _fail(job_row, error):
+    """Schedule a retry with growing delay, or give up after max_attempts."""
+    attempts = job_row.attempts + 1
+    retry = attempts < job_row.max_attempts
+    Job.objects.filter(id=job_row.id).update(
+        status=Job.QUEUED if retry else Job.FAILED,
+        run_after=timezone.now() + RETRY_DELAY * 2 ** (attempts - 1),
+        last_error=error,
+        updated_at=timezone.now(),
+    )
+
+
+def run(job_row):
+    """Run one claimed job in its own transaction; return True on success."""
+    try:
+        with transaction.atomic():
+            _registry[job_row.name](**job_row.payload)
+    except Exception:
+        _fail(job_row, traceback.format_exc())
+        return False
+    Job.objects.filter(id=job_row.id).update(status=Job.DONE, last_error='', updated_at=timezone.now())
+    return True
+
+
+def _run_eager(name, payload):
+    """Run a job in-process; on error log it and queue it for a retry."""
+    try:
+        with transaction.atomic():
+            _registry[name](**payload)
+    except Exception:
+        logger.exception('Job %s failed, queued for a retry', name)
+        Job.objects.create(
+            name=name, payload=payload, attempts=1,
+            run_after=timezone.now() + RETRY_DELAY, last_error=traceback.format_exc(),
+        )
+
+
+def run_pending(limit=100):
+    """Claim and run one batch of jobs; return (succeeded, failed)."""
+    results = [run(job_row) for job_row in claim(limit)]
+    return results.count(True), results.count(False)
+
+
+def purge_done(older_than=timedelta(days=1)):
+    """Delete finished jobs older than `older_than`; return how many."""
+    cutoff = timezone.now() - older_than
+    deleted, _ = Job.objects.filter(status=Job.DONE, updated_at__lt=cutoff).delete()
+    return deleted
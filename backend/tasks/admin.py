@@ -1,28 +1,115 @@
+from django import forms
 from django.contrib import admin
-from .models import Task, Subtask
+from django.contrib.admin.widgets import AutocompleteSelectMultiple
+from django.core.exceptions import ValidationError
+from django.forms.models import BaseInlineFormSet
+from django.utils.html import format_html, format_html_join
+from core.admin_pagination import EstimatedCountPaginator
+from .models import Task, Subtask, ArchivedTask
+
+SUBTASK_PAGE_PARAM = 'subtask_page'
+CONFLICT_MESSAGE = 'This task was changed by someone else since you opened it. Reload and try again.'
+BOARD_MISMATCH_MESSAGE = 'Only contacts of the task\'s board can be assigned.'
+
+
+def _subtask_page(request):
+    """Return the requested subtask inline page (1-based)."""
+    try:
+        return max(int(request.GET.get(SUBTASK_PAGE_PARAM, 1)), 1)
+    except ValueError:
+        return 1
+
+
+class PaginatedInlineFormSet(BaseInlineFormSet):
+    """Inline formset that only loads one page of related objects."""
+    page = 1
+    per_page = 50
+    
+    def get_queryset(self):
+        """Slice the related objects to the current page."""
+        if not hasattr(self, '_queryset'):
+            start = (self.page - 1) * self.per_page
+            self._queryset = super().get_queryset()[start:start + self.per_page]
+        return self._queryset
 
 
 class SubtaskInline(admin.TabularInline):
-    """Inline admin for subtasks within task admin."""
+    """Inline admin for subtasks within task admin, paginated for large tasks."""
     model = Subtask
+    formset = PaginatedInlineFormSet
     extra = 1
     fields = ['title', 'completed', 'order']
-    ordering = ['order']
+    ordering = ['order', 'id']
+    per_page = 50
+    
+    def get_formset(self, request, obj=None, **kwargs):
+        """Bind the requested page to the formset class."""
+        formset = super().get_formset(request, obj, **kwargs)
+        formset.page = _subtask_page(request)
+        formset.per_page = self.per_page
+        return formset
+
+
+class BoardContactsWidget(AutocompleteSelectMultiple):
+    """Contact autocomplete that only offers the contacts of one board."""
+    board_id = None
+    
+    def get_url(self):
+        """Pass the board to the autocomplete view (see ContactAdmin)."""
+        url = super().get_url()
+        return url if self.board_id is None else f'{url}?board={self.board_id}'
+
+
+class TaskAdminForm(forms.ModelForm):
+    """
+    Task form remembering the version the editor started from and keeping
+    the assigned contacts on the task's board.
+    """
+    loaded_version = forms.IntegerField(widget=forms.HiddenInput, required=False)
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        assigned_to = self.fields.get('assigned_to')
+        if self.instance.pk:
+            self.fields['loaded_version'].initial = self.instance.version
+        if self.instance.pk and assigned_to is not None:
+            assigned_to.queryset = assigned_to.queryset.filter(board_id=self.instance.board_id)
+            assigned_to.widget.widget.board_id = self.instance.board_id
+    
+    def clean(self):
+        """Reject contacts of other boards and edits of a changed task."""
+        cleaned_data = super().clean()
+        board = cleaned_data.get('board') or getattr(self.instance, 'board', None)
+        if board and any(contact.board_id != board.pk for contact in cleaned_data.get('assigned_to', ())):
+            self.add_error('assigned_to', BOARD_MISMATCH_MESSAGE)
+        self._check_version(cleaned_data.get('loaded_version'))
+        return cleaned_data
+    
+    def _check_version(self, loaded):
+        """Lock the task row and reject the edit if it changed in the meantime."""
+        if self.instance.pk and loaded is not None:
+            current = Task.objects.select_for_update().filter(pk=self.instance.pk).values_list('version', flat=True)
+            if current.first() != loaded:
+                raise ValidationError(CONFLICT_MESSAGE)
 
 
 @admin.register(Task)
 class TaskAdmin(admin.ModelAdmin):
     """Admin interface for Task model."""
-    list_display = ['title', 'status', 'priority', 'due_date', 'created_at']
-    list_filter = ['status', 'priority', 'created_at']
+    form = TaskAdminForm
+    list_display = ['title', 'board', 'status', 'priority', 'due_date', 'created_at']
+    list_filter = ['board', 'status', 'priority', 'created_at']
+    list_select_related = ['board']
     search_fields = ['title', 'description', 'category']
-    readonly_fields = ['created_at', 'updated_at']
-    filter_horizontal = ['assigned_to']
+    readonly_fields = ['subtask_pages', 'created_at', 'updated_at']
+    autocomplete_fields = ['assigned_to']
     inlines = [SubtaskInline]
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     
     fieldsets = (
         ('Basic Information', {
-            'fields': ('title', 'description', 'category')
+            'fields': ('board', 'title', 'description', 'category', 'loaded_version')
         }),
         ('Scheduling', {
             'fields': ('due_date', 'priority', 'status', 'order')
@@ -30,27 +117,80 @@ class TaskAdmin(admin.ModelAdmin):
         ('Assignment', {
             'fields': ('assigned_to',)
         }),
+        ('Subtasks', {
+            'fields': ('subtask_pages',)
+        }),
         ('Timestamps', {
             'fields': ('created_at', 'updated_at'),
             'classes': ('collapse',)
         }),
     )
     
-    def get_queryset(self, request):
-        """Optimize queryset with prefetch_related."""
-        qs = super().get_queryset(request)
-        return qs.prefetch_related('assigned_to', 'subtasks')
+    @admin.display(description='Subtask pages')
+    def subtask_pages(self, obj):
+        """Render links to the pages of the subtask inline."""
+        if obj is None or obj.pk is None:
+            return '-'
+        count = obj.subtasks.count()
+        pages = max((count - 1) // SubtaskInline.per_page + 1, 1)
+        links = format_html_join(
+            ' ', '<a href="?{}={}">{}</a>',
+            ((SUBTASK_PAGE_PARAM, page, page) for page in range(1, min(pages, 20) + 1)),
+        )
+        suffix = ' …' if pages > 20 else ''
+        return format_html('{} subtasks, page: {}{}', count, links, suffix)
+    
+    def get_readonly_fields(self, request, obj=None):
+        """Keep existing tasks on their board; their subtasks and contacts belong to it."""
+        readonly_fields = super().get_readonly_fields(request, obj)
+        return readonly_fields if obj is None else [*readonly_fields, 'board']
+    
+    def formfield_for_manytomany(self, db_field, request, **kwargs):
+        """Offer only contacts of the task's board in the assignment autocomplete."""
+        if db_field.name == 'assigned_to':
+            kwargs['widget'] = BoardContactsWidget(db_field, self.admin_site, using=kwargs.get('using'))
+        return super().formfield_for_manytomany(db_field, request, **kwargs)
+    
+    def save_model(self, request, obj, form, change):
+        """Advance the version so API clients notice admin edits."""
+        if change and not obj.advance_version(form.cleaned_data.get('loaded_version')):
+            raise ValidationError(CONFLICT_MESSAGE)
+        super().save_model(request, obj, form, change)
 
 
 @admin.register(Subtask)
 class SubtaskAdmin(admin.ModelAdmin):
     """Admin interface for Subtask model."""
-    list_display = ['title', 'task', 'completed', 'order']
-    list_filter = ['completed']
+    list_display = ['title', 'task', 'board', 'completed', 'order']
+    list_filter = ['board', 'completed']
     search_fields = ['title', 'task__title']
     list_editable = ['completed', 'order']
+    list_select_related = ['task', 'board']
+    readonly_fields = ['board']
+    autocomplete_fields = ['task']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    
+    def save_model(self, request, obj, form, change):
+        """Keep the subtask on the board of its task."""
+        obj.board_id = obj.task.board_id
+        super().save_model(request, obj, form, change)
+
+
+@admin.register(ArchivedTask)
+class ArchivedTaskAdmin(admin.ModelAdmin):
+    """Read-only admin interface for archived tasks."""
+    list_display = ['title', 'board', 'status', 'due_date', 'archived_at']
+    list_filter = ['board']
+    search_fields = ['title']
+    list_select_related = ['board']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    
+    def has_add_permission(self, request):
+        """Archived tasks are only created by the archive command."""
+        return False
     
-    def get_queryset(self, request):
-        """Optimize queryset with select_related."""
-        qs = super().get_queryset(request)
-        return qs.select_related('task')
+    def has_change_permission(self, request, obj=None):
+        """Archived tasks are immutable."""
+        return False
@@ -0,0 +1,37 @@
+"""
+Native async read views for tasks, used when ASYNC_READ_VIEWS is enabled.
+"""
+from asgiref.sync import sync_to_async
+from core.async_api import async_read_view, alist, aretrieve
+from .views import TaskViewSet
+
+task_list_fallback = TaskViewSet.as_view({'get': 'list', 'post': 'create'})
+task_detail_fallback = TaskViewSet.as_view({
+    'get': 'retrieve',
+    'put': 'update',
+    'patch': 'partial_update',
+    'delete': 'destroy',
+})
+
+
+@async_read_view(task_list_fallback)
+async def task_list(request):
+    """
+    List tasks with subtasks and assignments using the async ORM.
+    Requests including archived tasks are served by the sync view.
+
+    GET /api/tasks/
+    """
+    if 'include_archived' in request.GET:
+        return await sync_to_async(task_list_fallback)(request)
+    return await alist(TaskViewSet, request)
+
+
+@async_read_view(task_detail_fallback)
+async def task_detail(request, pk):
+    """
+    Retrieve a single task using the async ORM.
+
+    GET /api/tasks/{id}/
+    """
+    return await aretrieve(TaskViewSet, request, pk)
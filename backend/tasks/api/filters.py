@@ -0,0 +1,48 @@
+"""
+Filters for task list endpoints.
+"""
+import django_filters
+from django.db.models import Q
+from django.utils import timezone
+from django_filters.rest_framework import DjangoFilterBackend
+from tasks.models import Task, ArchivedTask
+
+
+class TaskFilter(django_filters.FilterSet):
+    """
+    FilterSet for tasks.
+    Adds due date ranges and an overdue switch to the plain field filters.
+    """
+    due_after = django_filters.DateTimeFilter(field_name='due_date', lookup_expr='gte')
+    due_before = django_filters.DateTimeFilter(field_name='due_date', lookup_expr='lt')
+    overdue = django_filters.BooleanFilter(method='filter_overdue')
+
+    class Meta:
+        model = Task
+        fields = ['status', 'priority', 'category']
+
+    def filter_overdue(self, queryset, name, value):
+        """Tasks past their due date that are not done (or the opposite)."""
+        overdue = Q(due_date__lt=timezone.now()) & ~Q(status='done')
+        return queryset.filter(overdue) if value else queryset.exclude(overdue)
+
+
+class ArchivedTaskFilter(TaskFilter):
+    """
+    Same filters applied to archived tasks.
+    """
+    class Meta(TaskFilter.Meta):
+        model = ArchivedTask
+
+
+class TaskFilterBackend(DjangoFilterBackend):
+    """
+    Filter backend that picks the filterset matching the queryset model,
+    so live and archived tasks accept the same query parameters.
+    """
+
+    def get_filterset_class(self, view, queryset=None):
+        """Use ArchivedTaskFilter for archived task querysets."""
+        if queryset is not None and queryset.model is ArchivedTask:
+            return ArchivedTaskFilter
+        return super().get_filterset_class(view, queryset)
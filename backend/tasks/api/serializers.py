@@ -1,11 +1,36 @@
 """
 Serializers for Task and Subtask models.
 """
-from rest_framework import serializers
-from tasks.models import Task, Subtask
+from django.db import transaction
+from rest_framework import serializers, status
+from rest_framework.exceptions import APIException
+from tasks.models import Task, Subtask, ArchivedTask, ArchivedSubtask
 from contacts.models import Contact
 
 
+class PreconditionFailed(APIException):
+    """Raised when the task changed since the version sent in `If-Match`."""
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = 'Task was modified by someone else. Reload and try again.'
+    default_code = 'precondition_failed'
+
+
+class VersionConflict(APIException):
+    """Raised when the task changed concurrently and no `If-Match` was sent."""
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = 'Task was modified concurrently. Reload and try again.'
+    default_code = 'conflict'
+
+
+def advance_task_version(task, expected_version=None, changes=None):
+    """
+    Write `changes` with the next task version, or raise PreconditionFailed
+    (with `If-Match`) or VersionConflict (without) on a concurrent change.
+    """
+    if not task.advance_version(expected_version, changes):
+        raise VersionConflict() if expected_version is None else PreconditionFailed()
+
+
 class SubtaskSerializer(serializers.ModelSerializer):
     """
     Serializer for Subtask model.
@@ -42,9 +67,17 @@ class TaskSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'title', 'description', 'due_date', 'priority',
             'category', 'status', 'assigned_to', 'subtasks',
-            'order', 'created_at', 'updated_at'
+            'order', 'version', 'created_at', 'updated_at'
         ]
-        read_only_fields = ['id', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'version', 'created_at', 'updated_at']
+    
+    def get_fields(self):
+        """Limit assignable contacts to the board of the request."""
+        fields = super().get_fields()
+        board = self.context.get('board')
+        if board is not None:
+            fields['assigned_to'].child_relation.queryset = Contact.objects.filter(board=board)
+        return fields
     
     def to_representation(self, instance):
         """
@@ -70,11 +103,30 @@ class TaskSerializer(serializers.ModelSerializer):
         
         return task
     
-    def _update_task_fields(self, instance, validated_data):
-        """Update task fields."""
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        instance.save()
+    def _changed_fields(self, instance, validated_data):
+        """Return the names of fields whose incoming value differs."""
+        return [
+            attr for attr, value in validated_data.items()
+            if getattr(instance, attr) != value
+        ]
+    
+    def _assignments_changed(self, instance, assigned_to_data):
+        """Check whether the incoming contacts differ from the current ones."""
+        if assigned_to_data is None:
+            return False
+        current = {contact.pk for contact in instance.assigned_to.all()}
+        return current != {contact.pk for contact in assigned_to_data}
+    
+    def _subtasks_changed(self, instance, subtasks_data):
+        """Check whether the incoming subtasks differ from the current ones."""
+        if subtasks_data is None:
+            return False
+        current = [(st.title, st.completed, st.order) for st in instance.subtasks.all()]
+        incoming = [
+            (st['title'], st.get('completed', False), st.get('order', 0))
+            for st in subtasks_data
+        ]
+        return current != incoming
     
     def _update_task_subtasks(self, instance, subtasks_data):
         """Replace existing subtasks with new ones."""
@@ -82,17 +134,80 @@ class TaskSerializer(serializers.ModelSerializer):
         for subtask_data in subtasks_data:
             Subtask.objects.create(task=instance, **subtask_data)
     
+    def _write_changes(self, instance, validated_data, changed_fields, assigned_to_data, subtasks_data):
+        """Write the changed columns with the next version, then the relations."""
+        with transaction.atomic():
+            advance_task_version(
+                instance, self.context.get('expected_version'),
+                {attr: validated_data[attr] for attr in changed_fields},
+            )
+            if assigned_to_data is not None:
+                instance.assigned_to.set(assigned_to_data)
+            if subtasks_data is not None:
+                self._update_task_subtasks(instance, subtasks_data)
+    
+    def _check_precondition(self, instance):
+        """Reject a no-op update sent against an outdated version."""
+        expected = self.context.get('expected_version')
+        if expected is not None and expected != instance.version:
+            raise PreconditionFailed()
+    
+    def _describe_changes(self, instance, validated_data, changed_fields, assign, rebuild):
+        """Summarize an update for the activity log."""
+        fields = changed_fields + ['assigned_to'] * assign + ['subtasks'] * rebuild
+        changes = {'fields': fields} if fields else {}
+        if 'status' in changed_fields:
+            changes['status'] = {'from': instance.status, 'to': validated_data['status']}
+        return changes
+    
     def update(self, instance, validated_data):
-        """Update task and handle nested subtasks."""
+        """
+        Update task and nested data, writing only what actually changed.
+        A request that changes nothing performs no write at all.
+        """
         subtasks_data = validated_data.pop('subtasks', None)
         assigned_to_data = validated_data.pop('assigned_to', None)
-        
-        self._update_task_fields(instance, validated_data)
-        
-        if assigned_to_data is not None:
-            instance.assigned_to.set(assigned_to_data)
-        
-        if subtasks_data is not None:
-            self._update_task_subtasks(instance, subtasks_data)
-        
+        changed_fields = self._changed_fields(instance, validated_data)
+        assign = self._assignments_changed(instance, assigned_to_data)
+        rebuild = self._subtasks_changed(instance, subtasks_data)
+        self.activity_changes = self._describe_changes(
+            instance, validated_data, changed_fields, assign, rebuild
+        )
+        if not self.activity_changes:
+            self._check_precondition(instance)
+            return instance
+        self._write_changes(
+            instance, validated_data, changed_fields,
+            assigned_to_data if assign else None,
+            subtasks_data if rebuild else None,
+        )
         return instance
+
+
+class ArchivedSubtaskSerializer(SubtaskSerializer):
+    """
+    Read-only serializer for archived subtasks.
+    """
+    class Meta(SubtaskSerializer.Meta):
+        model = ArchivedSubtask
+
+
+class ArchivedTaskSerializer(serializers.ModelSerializer):
+    """
+    Read-only serializer for archived tasks.
+    Uses the task representation plus `archived` and `archived_at`.
+    """
+    subtasks = ArchivedSubtaskSerializer(many=True, read_only=True)
+    
+    class Meta:
+        model = ArchivedTask
+        fields = TaskSerializer.Meta.fields + ['archived_at']
+        read_only_fields = fields
+    
+    def to_representation(self, instance):
+        """Convert IDs to strings and flag the task as archived."""
+        data = super().to_representation(instance)
+        data['id'] = str(data['id'])
+        data['assigned_to'] = [str(contact.id) for contact in instance.assigned_to.all()]
+        data['archived'] = True
+        return data
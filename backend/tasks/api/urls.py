@@ -1,13 +1,23 @@
 """
 URL configuration for tasks API.
 """
-from django.urls import path, include
+from django.conf import settings
+from django.urls import path, re_path, include
 from rest_framework.routers import DefaultRouter
 from .views import TaskViewSet
+from . import async_views
 
 router = DefaultRouter()
 router.register(r'tasks', TaskViewSet, basename='task')
 
-urlpatterns = [
+urlpatterns = []
+
+if settings.ASYNC_READ_VIEWS:
+    urlpatterns += [
+        re_path(r'^tasks/$', async_views.task_list, name='task-list-async'),
+        re_path(r'^tasks/(?P<pk>[0-9]+)/$', async_views.task_detail, name='task-detail-async'),
+    ]
+
+urlpatterns += [
     path('', include(router.urls)),
 ]
@@ -4,43 +4,220 @@ API views for Task management.
 from rest_framework import viewsets, permissions, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django_filters.rest_framework import DjangoFilterBackend
-from tasks.models import Task, Subtask
-from .serializers import TaskSerializer
+import base64
+import binascii
+import json
+from datetime import datetime, time, timedelta
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Q, Window
+from django.db.models.functions import RowNumber, TruncDate
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from activity.log import ActivityLogMixin, record
+from boards.scoping import BoardScopedMixin
+from core.response_cache import CachedResponseMixin
+from django.shortcuts import get_object_or_404
+from tasks import read_model
+from tasks.archive import restore_task
+from tasks.models import Task, ArchivedTask
+from .filters import TaskFilter, TaskFilterBackend
+from .serializers import (
+    TaskSerializer, ArchivedTaskSerializer, PreconditionFailed, advance_task_version,
+)
 
+BOARD_PAGE_SIZE = 20
+BOARD_MAX_PAGE_SIZE = 100
+BOARD_ORDERING = [F('order').asc(nulls_last=True), F('created_at').desc(), F('id').asc()]
+CALENDAR_DEFAULT_DAYS = 31
+CALENDAR_MAX_DAYS = 366
 
-class TaskViewSet(viewsets.ModelViewSet):
+
+def _parse_non_negative_int(value, default, maximum=None):
+    """Parse a query parameter as non-negative int, falling back to default."""
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return default
+    if number < 0:
+        return default
+    return min(number, maximum) if maximum is not None else number
+
+
+def _encode_board_cursor(task):
+    """Encode the sort key of the last card on a page as an opaque cursor."""
+    key = [task.order, task.created_at.isoformat(), task.id]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+def _decode_board_cursor(cursor):
+    """Return the (order, created_at, id) key of a cursor, or None if invalid."""
+    try:
+        order, created_at, pk = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        created_at = parse_datetime(created_at)
+    except (binascii.Error, ValueError, TypeError):
+        return None
+    if created_at is None or not isinstance(pk, int) or not isinstance(order, (int, type(None))):
+        return None
+    return order, created_at, pk
+
+
+def _after_board_card(order, created_at, pk):
+    """
+    Match the cards following a card in BOARD_ORDERING (keyset pagination),
+    so every page is an index range scan regardless of its depth.
+    """
+    later_in_slot = Q(created_at__lt=created_at) | Q(created_at=created_at, id__gt=pk)
+    if order is None:
+        return Q(order__isnull=True) & later_in_slot
+    return Q(order__gt=order) | Q(order__isnull=True) | (Q(order=order) & later_in_slot)
+
+
+def _parse_date_param(params, name):
+    """Return the date in a query parameter, None if absent; ValueError if invalid."""
+    value = params.get(name, '')
+    if not value:
+        return None
+    day = parse_date(value)
+    if day is None:
+        raise ValueError(value)
+    return day
+
+
+def _parse_calendar_window(params):
+    """
+    Parse `start` and `end` (inclusive ISO dates) of a calendar request.
+    Returns (start, end, error); defaults to a month starting today.
+    """
+    try:
+        start = _parse_date_param(params, 'start') or timezone.localdate()
+        end = _parse_date_param(params, 'end') or start + timedelta(days=CALENDAR_DEFAULT_DAYS - 1)
+    except ValueError:
+        return None, None, 'start and end must be valid dates (YYYY-MM-DD).'
+    if end < start:
+        return None, None, 'end must not be before start.'
+    if (end - start).days >= CALENDAR_MAX_DAYS:
+        return None, None, f'The window may span at most {CALENDAR_MAX_DAYS} days.'
+    return start, end, None
+
+
+def _start_of_day(day):
+    """Return midnight of a date as an aware datetime."""
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def _parse_if_match(header):
+    """Return the task version sent in `If-Match`, or None if absent or `*`."""
+    if not header or header.strip() == '*':
+        return None
+    value = header.strip().removeprefix('W/').strip('"')
+    try:
+        return int(value)
+    except ValueError:
+        raise PreconditionFailed()
+
+
+class TaskViewSet(
+    ActivityLogMixin, BoardScopedMixin, CachedResponseMixin, read_model.ReadModelListMixin, viewsets.ModelViewSet
+):
     """
     ViewSet for Task model.
-    Provides CRUD operations for tasks.
-    All authenticated users can access and manage tasks.
+    Provides CRUD operations for the tasks of the current board
+    (`X-Board` header or `board` parameter, default board otherwise).
     
     Supports:
-    - Filtering by status, priority
+    - Filtering by status, priority, due date range (`due_after`,
+      `due_before`) and `overdue`
     - Searching across title, description, category
     - Ordering by any field
+    - Per-column board loading via the `board` action
+    - Per-day due date counts via the `calendar` action
+    - Status, priority and deadline counts via the `summary` action
+    - Lists and summaries served from the in-process read model
+      (TASK_READ_MODEL)
+    - Shared response cache for list and retrieve
+    - Optimistic concurrency via `ETag` / `If-Match` on the task version
+    - Archived tasks via `?include_archived=true` and the `restore` action
+    - Activity log entries for every change
     """
+    cache_namespace = 'tasks'
     queryset = Task.objects.all()
     serializer_class = TaskSerializer
     permission_classes = [permissions.IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['status', 'priority', 'category']
+    filter_backends = [TaskFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filterset_class = TaskFilter
     search_fields = ['title', 'description', 'category']
     ordering_fields = '__all__'
     ordering = ['order', '-created_at']
     
     def get_queryset(self):
         """
-        Optimize queryset with prefetch_related for subtasks and assigned contacts.
+        Scope tasks to the board and prefetch subtasks and assigned contacts.
+        """
+        return Task.objects.filter(board=self.board).prefetch_related('subtasks', 'assigned_to')
+    
+    def get_serializer_context(self):
+        """Pass the version from `If-Match` on to the serializer."""
+        context = super().get_serializer_context()
+        context['expected_version'] = self._expected_version()
+        return context
+    
+    def _archived_queryset(self):
+        """Return the board's archived tasks with their relations."""
+        return ArchivedTask.objects.filter(board=self.board).prefetch_related('subtasks', 'assigned_to')
+    
+    def _include_archived(self, request):
+        """Check whether the client asked for archived tasks as well."""
+        return request.query_params.get('include_archived', '').lower() in ('1', 'true', 'yes')
+    
+    def list(self, request, *args, **kwargs):
+        """List tasks, appending archived tasks if requested."""
+        response = super().list(request, *args, **kwargs)
+        if response.status_code != 200 or not self._include_archived(request):
+            return response
+        archived = self.filter_queryset(self._archived_queryset())
+        response.data = response.data + ArchivedTaskSerializer(archived, many=True).data
+        return response
+    
+    @action(detail=False, methods=['post'], url_path=r'archived/(?P<archived_pk>[0-9]+)/restore')
+    def restore(self, request, archived_pk=None):
+        """
+        Move an archived task back onto the board.
+        
+        POST /api/tasks/archived/{id}/restore/
         """
-        return Task.objects.prefetch_related('subtasks', 'assigned_to').all()
+        archived = get_object_or_404(self._archived_queryset(), pk=archived_pk)
+        task = restore_task(archived)
+        record(request, 'restored', task)
+        serializer = self.get_serializer(self.get_queryset().get(pk=task.pk))
+        return Response(serializer.data, status=201)
+    
+    def _expected_version(self):
+        """Return the task version a writing request expects, if it sent one."""
+        if self.request.method in permissions.SAFE_METHODS:
+            return None
+        return _parse_if_match(self.request.headers.get('If-Match'))
+    
+    def finalize_response(self, request, response, *args, **kwargs):
+        """Expose the task version of detail responses as `ETag`."""
+        response = super().finalize_response(request, response, *args, **kwargs)
+        data = getattr(response, 'data', None)
+        if isinstance(data, dict) and 'version' in data:
+            response['ETag'] = f'"{data["version"]}"'
+        return response
     
     def _validate_and_update_status(self, task, new_status):
-        """Validate and update task status."""
+        """Validate and update task status, writing only when it changed."""
         if new_status not in dict(Task.STATUS_CHOICES):
             return None
-        task.status = new_status
-        task.save()
+        expected = self._expected_version()
+        if task.status == new_status:
+            if expected is not None and expected != task.version:
+                raise PreconditionFailed()
+            return task
+        with transaction.atomic():
+            record(self.request, 'status_changed', task, {'status': {'from': task.status, 'to': new_status}})
+            advance_task_version(task, expected, {'status': new_status})
         return task
     
     @action(detail=True, methods=['patch'])
@@ -64,14 +241,21 @@ class TaskViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
     
     def _toggle_subtask_completion(self, task, subtask_id):
-        """Toggle subtask completion status."""
-        try:
-            subtask = task.subtasks.get(id=subtask_id)
-            subtask.completed = not subtask.completed
-            subtask.save()
-            return task
-        except Subtask.DoesNotExist:
+        """Toggle subtask completion status on the prefetched subtask."""
+        subtask = next(
+            (st for st in task.subtasks.all() if str(st.id) == str(subtask_id)),
+            None,
+        )
+        if subtask is None:
             return None
+        with transaction.atomic():
+            advance_task_version(task, self._expected_version())
+            subtask.completed = not subtask.completed
+            subtask.save(update_fields=['completed'])
+            record(self.request, 'subtask_toggled', task, {
+                'subtask': {'id': subtask.id, 'title': subtask.title, 'completed': subtask.completed},
+            })
+        return task
     
     @action(detail=True, methods=['patch'])
     def toggle_subtask(self, request, pk=None):
@@ -92,3 +276,105 @@ class TaskViewSet(viewsets.ModelViewSet):
         
         serializer = self.get_serializer(updated_task)
         return Response(serializer.data)
+
+    def _board_page_size(self, request):
+        """Return the requested number of cards per column."""
+        return _parse_non_negative_int(
+            request.query_params.get('limit'), BOARD_PAGE_SIZE, BOARD_MAX_PAGE_SIZE
+        ) or BOARD_PAGE_SIZE
+
+    def _first_board_pages(self, queryset, limit):
+        """
+        Fetch the first `limit` + 1 cards of every column in one query.
+        The extra row per column tells whether more cards exist.
+        """
+        row_number = Window(RowNumber(), partition_by=[F('status')], order_by=BOARD_ORDERING)
+        rows = queryset.annotate(board_row=row_number).filter(board_row__lte=limit + 1)
+        columns = {status: [] for status, _ in Task.STATUS_CHOICES}
+        for task in rows.order_by('status', 'board_row'):
+            columns[task.status].append(task)
+        return columns
+
+    def _next_board_page(self, queryset, status, key, limit):
+        """Fetch the cards of a single column following the cursor's card."""
+        rows = queryset.filter(_after_board_card(*key), status=status).order_by(*BOARD_ORDERING)
+        return {status: list(rows[:limit + 1])}
+
+    def _serialize_board_column(self, tasks, limit):
+        """Serialize one column page and compute its next cursor."""
+        page = tasks[:limit]
+        return {
+            'results': self.get_serializer(page, many=True).data,
+            'next_cursor': _encode_board_cursor(page[-1]) if len(tasks) > limit else None,
+        }
+
+    @action(detail=False, methods=['get'])
+    def board(self, request):
+        """
+        Return the first cards of every status column in one round trip.
+
+        GET /api/tasks/board/?limit=20
+        GET /api/tasks/board/?status=done&cursor=<next_cursor>&limit=20
+        """
+        limit = self._board_page_size(request)
+        queryset = self.filter_queryset(self.get_queryset())
+        status = request.query_params.get('status')
+        cursor = request.query_params.get('cursor')
+        if status and cursor is not None:
+            key = _decode_board_cursor(cursor)
+            if key is None:
+                return Response({'error': 'Invalid cursor.'}, status=400)
+            pages = self._next_board_page(queryset, status, key, limit)
+        else:
+            pages = self._first_board_pages(queryset, limit)
+        return Response({
+            status: self._serialize_board_column(tasks, limit) for status, tasks in pages.items()
+        })
+
+    def _calendar_days(self, queryset, start, end):
+        """Count tasks per due day and status in one grouped query."""
+        window_end = _start_of_day(end + timedelta(days=1))
+        rows = (
+            queryset.filter(due_date__gte=_start_of_day(start), due_date__lt=window_end)
+            .annotate(day=TruncDate('due_date'))
+            .values('day', 'status')
+            .annotate(count=Count('id'))
+            .order_by('day', 'status')
+        )
+        days = {}
+        for row in rows:
+            day = days.setdefault(row['day'], {'date': row['day'], 'total': 0, 'by_status': {}})
+            day['total'] += row['count']
+            day['by_status'][row['status']] = row['count']
+        return list(days.values())
+
+    @action(detail=False, methods=['get'])
+    def calendar(self, request):
+        """
+        Return the number of tasks due on each day of a date window.
+        Days without due tasks are omitted. Task filters apply as usual.
+
+        GET /api/tasks/calendar/?start=2026-02-01&end=2026-02-28
+        """
+        start, end, error = _parse_calendar_window(request.query_params)
+        if error:
+            return Response({'error': error}, status=400)
+        queryset = self.filter_queryset(self.get_queryset()).prefetch_related(None)
+        days = self._calendar_days(queryset, start, end)
+        return Response({'start': start, 'end': end, 'days': days})
+
+    @action(detail=False, methods=['get'])
+    def summary(self, request):
+        """
+        Return task counts per status and priority, the number of overdue
+        tasks and the earliest deadline of an open urgent task.
+        Task filters apply as usual.
+
+        GET /api/tasks/summary/
+        """
+        now = timezone.now()
+        records = read_model.query(self) if settings.TASK_READ_MODEL else None
+        if records is not None:
+            return Response(read_model.summarize(records, now))
+        queryset = self.filter_queryset(self.get_queryset()).prefetch_related(None)
+        return Response(read_model.summarize_queryset(queryset, now))
@@ -0,0 +1,86 @@
+"""
+Moving completed tasks between the hot `tasks` table and the archive.
+
+Archiving runs in batches, each in its own transaction, so the hot
+table is never locked for long and an interrupted run loses no data.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Task, Subtask, ArchivedTask, ArchivedSubtask
+
+TASK_FIELDS = [
+    'id', 'board_id', 'title', 'description', 'due_date', 'priority',
+    'category', 'status', 'order', 'version', 'created_at', 'updated_at',
+]
+SUBTASK_FIELDS = ['id', 'board_id', 'task_id', 'title', 'completed', 'order']
+
+
+def _copy(source, target_class, fields):
+    """Build an unsaved `target_class` instance from the given fields."""
+    return target_class(**{field: getattr(source, field) for field in fields})
+
+
+def archivable_tasks(older_than_days=None):
+    """Return done tasks not changed within the configured number of days."""
+    days = settings.TASK_ARCHIVE_AFTER_DAYS if older_than_days is None else older_than_days
+    cutoff = timezone.now() - timedelta(days=days)
+    return Task.objects.filter(status='done', updated_at__lt=cutoff)
+
+
+def _assignment_rows(through, tasks, task_field):
+    """Build the assignment join rows of the given tasks for `through`."""
+    return [
+        through(**{task_field: task.id, 'contact_id': contact.id})
+        for task in tasks
+        for contact in task.assigned_to.all()
+    ]
+
+
+@transaction.atomic
+def _archive_batch(task_ids):
+    """Copy one batch of tasks into the archive and delete the originals."""
+    tasks = list(
+        Task.objects.filter(id__in=task_ids, status='done')
+        .prefetch_related('subtasks', 'assigned_to')
+    )
+    ArchivedTask.objects.bulk_create([_copy(task, ArchivedTask, TASK_FIELDS) for task in tasks])
+    ArchivedTask.assigned_to.through.objects.bulk_create(
+        _assignment_rows(ArchivedTask.assigned_to.through, tasks, 'archivedtask_id')
+    )
+    ArchivedSubtask.objects.bulk_create([
+        _copy(subtask, ArchivedSubtask, SUBTASK_FIELDS)
+        for task in tasks for subtask in task.subtasks.all()
+    ])
+    Task.objects.filter(id__in=[task.id for task in tasks]).delete()
+    return len(tasks)
+
+
+def archive_done_tasks(older_than_days=None, batch_size=500):
+    """Archive all archivable tasks in batches and return how many moved."""
+    moved = 0
+    queryset = archivable_tasks(older_than_days).order_by('id').values_list('id', flat=True)
+    while True:
+        task_ids = list(queryset[:batch_size])
+        if not task_ids:
+            return moved
+        moved += _archive_batch(task_ids)
+
+
+@transaction.atomic
+def restore_task(archived):
+    """Move an archived task with its subtasks back into the hot table."""
+    task = _copy(archived, Task, TASK_FIELDS)
+    task.version = archived.version + 1
+    task.save(force_insert=True)
+    Task.objects.filter(pk=task.pk).update(created_at=archived.created_at)
+    task.created_at = archived.created_at
+    task.assigned_to.set(archived.assigned_to.all())
+    Subtask.objects.bulk_create([
+        _copy(subtask, Subtask, SUBTASK_FIELDS) for subtask in archived.subtasks.all()
+    ])
+    archived.delete()
+    return task
@@ -0,0 +1,15 @@
+"""
+Background jobs for tasks.
+"""
+from boards.models import Board
+from core.response_cache import warm_list
+from jobs.queue import job
+from .api.views import TaskViewSet
+
+
+@job('tasks.warm_list')
+def warm_task_list(board_id):
+    """Refill the cached task list of a board after it was invalidated."""
+    board = Board.objects.filter(pk=board_id).first()
+    if board is not None:
+        warm_list(TaskViewSet, board)
@@ -0,0 +1,26 @@
+"""
+Move old completed tasks into the archive tables.
+"""
+from django.core.management.base import BaseCommand
+
+from tasks.archive import archivable_tasks, archive_done_tasks
+
+
+class Command(BaseCommand):
+    """Archive done tasks older than the configured age in batches."""
+    help = 'Move done tasks older than TASK_ARCHIVE_AFTER_DAYS into the archive.'
+
+    def add_arguments(self, parser):
+        """Register command line options."""
+        parser.add_argument('--days', type=int, default=None, help='Override TASK_ARCHIVE_AFTER_DAYS')
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--dry-run', action='store_true', help='Only count archivable tasks')
+
+    def handle(self, *args, **options):
+        """Run the archival and report the number of moved tasks."""
+        if options['dry_run']:
+            count = archivable_tasks(options['days']).count()
+            self.stdout.write(f'{count} tasks would be archived')
+            return
+        moved = archive_done_tasks(options['days'], options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'{moved} tasks archived'))
@@ -0,0 +1,102 @@
+"""
+Compare the task read model with the database path.
+"""
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand, CommandError
+from django.http import HttpRequest, QueryDict
+from django.utils import timezone
+from rest_framework.request import Request
+
+from boards.models import Board
+from tasks import read_model
+from tasks.api.views import TaskViewSet
+
+SCENARIOS = {
+    'list': ('list', ''),
+    'filter': ('list', 'status=todo&priority=urgent&search=a&ordering=due_date'),
+    'summary': ('summary', ''),
+}
+
+
+def _view(board, action, query):
+    """Build a TaskViewSet for a board and query string without dispatching it."""
+    request = HttpRequest()
+    request.GET = QueryDict(query)
+    view = TaskViewSet(action=action, kwargs={}, format_kwarg=None)
+    view.request = Request(request)
+    view.board = board
+    return view
+
+
+def _from_database(view):
+    """Produce the response data of a view through the ORM."""
+    queryset = view.filter_queryset(view.get_queryset())
+    if view.action == 'summary':
+        return read_model.summarize_queryset(queryset.prefetch_related(None), timezone.now())
+    return view.get_serializer(queryset, many=True).data
+
+
+def _from_memory(view):
+    """Produce the response data of a view from the read model."""
+    records = read_model.query(view)
+    if view.action == 'summary':
+        return read_model.summarize(records, timezone.now())
+    return [read_model.render(record) for record in records]
+
+
+def _measure(produce, view, iterations):
+    """Return the mean time per call in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        produce(view)
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+class Command(BaseCommand):
+    """Report the memory footprint and latency of the task read model."""
+    help = 'Measure memory and latency of the task read model against the database.'
+
+    def add_arguments(self, parser):
+        """Register command line options."""
+        parser.add_argument('--board', type=int, help='Board id (default: the default board)')
+        parser.add_argument('--iterations', type=int, default=50)
+
+    def handle(self, *args, **options):
+        """Load the board, then time every scenario on both paths."""
+        board = Board.objects.filter(pk=options['board']).first() if options['board'] else Board.get_default()
+        if board is None:
+            raise CommandError('Board not found.')
+        self._report_memory(board)
+        self.stdout.write(f'{"scenario":<10} {"database":>12} {"memory":>12} {"speedup":>8}')
+        for name, (action, query) in SCENARIOS.items():
+            view = _view(board, action, query)
+            database_ms = _measure(_from_database, view, options['iterations'])
+            memory_ms = _measure(_from_memory, view, options['iterations'])
+            self.stdout.write(
+                f'{name:<10} {database_ms:9.2f} ms {memory_ms:9.2f} ms {database_ms / memory_ms:7.1f}x'
+            )
+
+    def _report_memory(self, board):
+        """
+        Print the size of the board's records, once loaded and once every
+        record holds its rendered form as in a serving worker, next to the
+        equivalent ORM objects.
+        """
+        tracemalloc.start()
+        records = read_model.load_records(board.pk)
+        loaded_size, _ = tracemalloc.get_traced_memory()
+        for record in records.values():
+            read_model.render(record)
+        rendered_size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        tracemalloc.start()
+        instances = list(_view(board, 'list', '').get_queryset())
+        orm_size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.stdout.write(
+            f'{len(records)} tasks: read model {loaded_size / 1024:.1f} KiB loaded, '
+            f'{rendered_size / 1024:.1f} KiB rendered; '
+            f'ORM instances {orm_size / 1024:.1f} KiB ({len(instances)} with prefetched relations)'
+        )
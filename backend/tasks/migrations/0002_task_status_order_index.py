@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-19 17:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contacts', '0001_initial'),
+        ('tasks', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['status', 'order', '-created_at'], name='tasks_status_order_idx'),
+        ),
+    ]
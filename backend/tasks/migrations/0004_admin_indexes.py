@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-19 17:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contacts', '0002_admin_indexes'),
+        ('tasks', '0003_task_version'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['created_at'], name='tasks_created_at_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 6.0.2 on 2026-10-19 17:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def assign_default_board(apps, schema_editor):
+    """Move all existing tasks and subtasks into the default board."""
+    Board = apps.get_model('boards', 'Board')
+    Task = apps.get_model('tasks', 'Task')
+    Subtask = apps.get_model('tasks', 'Subtask')
+    board = Board.objects.get(is_default=True)
+    Task.objects.filter(board__isnull=True).update(board=board)
+    Subtask.objects.filter(board__isnull=True).update(board=board)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0001_initial'),
+        ('tasks', '0004_admin_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='board',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='tasks', to='boards.board'),
+        ),
+        migrations.AddField(
+            model_name='subtask',
+            name='board',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='subtasks', to='boards.board'),
+        ),
+        migrations.RunPython(assign_default_board, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 6.0.2 on 2026-10-19 17:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0005_task_board'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='task',
+            name='board',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tasks', to='boards.board'),
+        ),
+        migrations.AlterField(
+            model_name='subtask',
+            name='board',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='subtasks', to='boards.board'),
+        ),
+        migrations.RemoveIndex(
+            model_name='task',
+            name='tasks_status_order_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='task',
+            name='tasks_created_at_idx',
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['board', 'status', 'order', '-created_at'], name='tasks_board_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['board', 'created_at'], name='tasks_board_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='subtask',
+            index=models.Index(fields=['board', 'task', 'order'], name='subtasks_board_task_idx'),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 6.0.2 on 2026-10-19 17:22
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0001_initial'),
+        ('contacts', '0004_contact_board_required'),
+        ('tasks', '0006_board_required'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedTask',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=255)),
+                ('description', models.TextField(blank=True, default='')),
+                ('due_date', models.DateTimeField()),
+                ('priority', models.CharField(choices=[('urgent', 'Urgent'), ('medium', 'Medium'), ('low', 'Low')], max_length=10)),
+                ('category', models.CharField(max_length=100)),
+                ('status', models.CharField(choices=[('todo', 'To Do'), ('inprogress', 'In Progress'), ('awaitfeedback', 'Await Feedback'), ('done', 'Done')], max_length=20)),
+                ('order', models.IntegerField(blank=True, null=True)),
+                ('version', models.PositiveIntegerField(default=1)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('assigned_to', models.ManyToManyField(blank=True, db_table='archived_tasks_assigned_to', related_name='archived_tasks', to='contacts.contact')),
+                ('board', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_tasks', to='boards.board')),
+            ],
+            options={
+                'db_table': 'archived_tasks',
+                'ordering': ['-archived_at', '-id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedSubtask',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=255)),
+                ('completed', models.BooleanField(default=False)),
+                ('order', models.IntegerField(default=0)),
+                ('board', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_subtasks', to='boards.board')),
+                ('task', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='subtasks', to='tasks.archivedtask')),
+            ],
+            options={
+                'db_table': 'archived_subtasks',
+                'ordering': ['order', 'id'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='archivedtask',
+            index=models.Index(fields=['board', '-archived_at'], name='archived_board_archived_idx'),
+        ),
+    ]
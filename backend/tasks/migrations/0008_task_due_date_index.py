@@ -0,0 +1,17 @@
+# Generated by Django 6.0.2 on 2026-10-19 17:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0007_archived_tasks'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['board', 'due_date'], name='tasks_board_due_date_idx'),
+        ),
+    ]
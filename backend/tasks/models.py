@@ -1,11 +1,14 @@
 from django.db import models
+from django.db.models.signals import post_save
+from django.utils import timezone
+from boards.models import Board
 from contacts.models import Contact
 
 
 class Task(models.Model):
     """
-    Task model representing a shared board task.
-    All tasks are visible to all authenticated users.
+    Task model representing a task on a board.
+    Tasks are visible to all users with access to the board.
     """
     PRIORITY_CHOICES = [
         ('urgent', 'Urgent'),
@@ -20,6 +23,7 @@ class Task(models.Model):
         ('done', 'Done'),
     ]
     
+    board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name='tasks')
     title = models.CharField(max_length=255)
     description = models.TextField(blank=True, default='')
     due_date = models.DateTimeField()
@@ -28,21 +32,51 @@ class Task(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='todo')
     assigned_to = models.ManyToManyField(Contact, related_name='assigned_tasks', blank=True)
     order = models.IntegerField(null=True, blank=True)
+    version = models.PositiveIntegerField(default=1, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
         ordering = ['order', '-created_at']
         db_table = 'tasks'
+        indexes = [
+            models.Index(fields=['board', 'status', 'order', '-created_at'], name='tasks_board_status_idx'),
+            models.Index(fields=['board', 'created_at'], name='tasks_board_created_idx'),
+            models.Index(fields=['created_at'], name='tasks_created_at_idx'),
+            models.Index(fields=['board', 'due_date'], name='tasks_board_due_date_idx'),
+        ]
     
     def __str__(self):
         return f"{self.title} ({self.get_status_display()})"
+    
+    def advance_version(self, expected_version=None, changes=None):
+        """
+        Write `changes` (field name -> value) and increment the version in a
+        single UPDATE, if the version still equals `expected_version`
+        (defaults to the loaded version). Sends `post_save` like `save()`.
+        Returns False on a concurrent change.
+        """
+        expected = self.version if expected_version is None else expected_version
+        changes = {**(changes or {}), 'updated_at': timezone.now()}
+        rows = Task.objects.filter(pk=self.pk, version=expected)
+        if not rows.update(version=models.F('version') + 1, **changes):
+            return False
+        for field, value in changes.items():
+            setattr(self, field, value)
+        self.version = expected + 1
+        post_save.send(
+            Task, instance=self, created=False, raw=False, using=rows.db,
+            update_fields=frozenset(changes) | {'version'},
+        )
+        return True
 
 
 class Subtask(models.Model):
     """
     Subtask model representing a sub-item of a task.
+    Carries the board of its task so subtask queries stay board-scoped.
     """
+    board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name='subtasks')
     task = models.ForeignKey(Task, on_delete=models.CASCADE, related_name='subtasks')
     title = models.CharField(max_length=255)
     completed = models.BooleanField(default=False)
@@ -51,6 +85,68 @@ class Subtask(models.Model):
     class Meta:
         ordering = ['order', 'id']
         db_table = 'subtasks'
+        indexes = [
+            models.Index(fields=['board', 'task', 'order'], name='subtasks_board_task_idx'),
+        ]
+    
+    def __str__(self):
+        status = "✓" if self.completed else "○"
+        return f"{status} {self.title}"
+    
+    def save(self, *args, **kwargs):
+        """Inherit the board from the task if not set explicitly."""
+        if self.board_id is None:
+            self.board_id = self.task.board_id
+        super().save(*args, **kwargs)
+
+
+class ArchivedTask(models.Model):
+    """
+    Cold copy of a completed task moved out of the hot `tasks` table.
+    Keeps the original id so a restored task is reachable under it again.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name='archived_tasks')
+    title = models.CharField(max_length=255)
+    description = models.TextField(blank=True, default='')
+    due_date = models.DateTimeField()
+    priority = models.CharField(max_length=10, choices=Task.PRIORITY_CHOICES)
+    category = models.CharField(max_length=100)
+    status = models.CharField(max_length=20, choices=Task.STATUS_CHOICES)
+    assigned_to = models.ManyToManyField(
+        Contact, related_name='archived_tasks', blank=True, db_table='archived_tasks_assigned_to'
+    )
+    order = models.IntegerField(null=True, blank=True)
+    version = models.PositiveIntegerField(default=1)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        ordering = ['-archived_at', '-id']
+        db_table = 'archived_tasks'
+        indexes = [
+            models.Index(fields=['board', '-archived_at'], name='archived_board_archived_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.title} (archived)"
+
+
+class ArchivedSubtask(models.Model):
+    """
+    Cold copy of a subtask belonging to an archived task.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name='archived_subtasks')
+    task = models.ForeignKey(ArchivedTask, on_delete=models.CASCADE, related_name='subtasks')
+    title = models.CharField(max_length=255)
+    completed = models.BooleanField(default=False)
+    order = models.IntegerField(default=0)
+    
+    class Meta:
+        ordering = ['order', 'id']
+        db_table = 'archived_subtasks'
     
     def __str__(self):
         status = "✓" if self.completed else "○"
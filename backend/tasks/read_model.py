@@ -0,0 +1,332 @@
+"""
+Optional in-process read model of the task boards (TASK_READ_MODEL).
+
+Each worker keeps a compact copy of the boards it serves: one slotted
+record per task with interned status, priority and category strings and
+the assigned contacts as a tuple of ids. Task lists, filters and the
+summary are answered from that copy without touching the database.
+
+Every board has a task generation in the database, advanced once within
+each transaction that changes its tasks, so it commits (or rolls back)
+together with the change. The worker that made the write patches the
+changed tasks into its copy (write-through); any other worker notices the
+newer generation on its next read and reloads the board with three
+queries. Requests using parameters the read model does not understand
+fall back to the regular database path.
+"""
+import sys
+import threading
+from functools import partial
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Count, Min, Q
+from django.utils import timezone
+from rest_framework import filters, serializers
+from rest_framework.response import Response
+
+from boards.models import Board
+from boards.scoping import BOARD_PARAM
+from core.transactions import is_pending, on_commit_once
+from tasks.api.filters import TaskFilter
+from tasks.models import Task, Subtask
+
+NAMESPACE = 'task-records'
+TASK_COLUMNS = (
+    'id', 'title', 'description', 'due_date', 'priority', 'category',
+    'status', 'order', 'version', 'created_at', 'updated_at',
+)
+ORDERABLE_FIELDS = frozenset(TASK_COLUMNS)
+FILTER_FIELDS = ('status', 'priority', 'category')
+SEARCH_FIELDS = ('title', 'description', 'category')
+SUPPORTED_PARAMS = frozenset(
+    FILTER_FIELDS + ('due_after', 'due_before', 'overdue', 'search', 'ordering', 'include_archived', BOARD_PARAM)
+)
+STATUSES = [status for status, _ in Task.STATUS_CHOICES]
+PRIORITIES = [priority for priority, _ in Task.PRIORITY_CHOICES]
+
+_datetime = serializers.DateTimeField()
+_snapshots = {}
+_lock = threading.Lock()
+
+
+class SubtaskRecord:
+    """Compact, immutable copy of a subtask."""
+    __slots__ = ('id', 'title', 'completed', 'order')
+
+    def __init__(self, id, title, completed, order):
+        self.id = id
+        self.title = title
+        self.completed = completed
+        self.order = order
+
+
+class TaskRecord:
+    """
+    Compact, immutable copy of a task with its subtasks and assignments.
+    Keeps its serialized form once it has been rendered.
+    """
+    __slots__ = TASK_COLUMNS + ('assigned_to', 'subtasks', 'data')
+
+    def __init__(self, row, assigned_to, subtasks):
+        for name, value in zip(TASK_COLUMNS, row):
+            setattr(self, name, value)
+        self.status = sys.intern(self.status)
+        self.priority = sys.intern(self.priority)
+        self.category = sys.intern(self.category)
+        self.assigned_to = assigned_to
+        self.subtasks = subtasks
+        self.data = None
+
+
+class BoardSnapshot:
+    """The task records of one board at one generation."""
+    __slots__ = ('generation', 'tasks', '_orderings')
+
+    def __init__(self, generation, tasks):
+        self.generation = generation
+        self.tasks = tasks
+        self._orderings = {}
+
+    def patched(self, generation, task_ids, records):
+        """Return a new snapshot with the given tasks replaced or removed."""
+        tasks = {pk: record for pk, record in self.tasks.items() if pk not in task_ids}
+        tasks.update(records)
+        return BoardSnapshot(generation, tasks)
+
+    def ordered(self, ordering):
+        """Return all records sorted by `ordering`, memoized per snapshot."""
+        key = tuple(ordering)
+        if key not in self._orderings:
+            self._orderings[key] = sort_records(self.tasks.values(), key)
+        return self._orderings[key]
+
+
+def _group(rows, make):
+    """Group (task_id, *values) rows into {task_id: tuple of make(*values)}."""
+    groups = {}
+    for task_id, *values in rows:
+        groups.setdefault(task_id, []).append(make(*values))
+    return {task_id: tuple(items) for task_id, items in groups.items()}
+
+
+def load_records(board_id, task_ids=None):
+    """Load {task_id: TaskRecord} for a board (or some of its tasks) in three queries."""
+    tasks = Task.objects.filter(board_id=board_id).order_by('id')
+    subtasks = Subtask.objects.filter(board_id=board_id).order_by('task_id', 'order', 'id')
+    assignments = Task.assigned_to.through.objects.filter(task__board_id=board_id).order_by(
+        'task_id', 'contact__firstname', 'contact__lastname'
+    )
+    if task_ids is not None:
+        tasks, subtasks, assignments = (
+            tasks.filter(id__in=task_ids), subtasks.filter(task_id__in=task_ids),
+            assignments.filter(task_id__in=task_ids),
+        )
+    subtasks = _group(subtasks.values_list('task_id', 'id', 'title', 'completed', 'order'), SubtaskRecord)
+    assigned = _group(assignments.values_list('task_id', 'contact_id'), int)
+    return {
+        row[0]: TaskRecord(row, assigned.get(row[0], ()), subtasks.get(row[0], ()))
+        for row in tasks.values_list(*TASK_COLUMNS)
+    }
+
+
+def get_snapshot(board_id):
+    """
+    Return the current snapshot of a board, (re)loading it if another
+    process advanced the generation. None if the board does not exist.
+    """
+    current = Board.objects.filter(pk=board_id).values_list('task_generation', flat=True).first()
+    if current is None:
+        return None
+    snapshot = _snapshots.get(board_id)
+    if snapshot is None or snapshot.generation != current:
+        snapshot = BoardSnapshot(current, load_records(board_id))
+        with _lock:
+            _snapshots[board_id] = snapshot
+    return snapshot
+
+
+def _apply(board_id, new, task_ids):
+    """
+    Patch the local snapshot to generation `new` if it was exactly one
+    generation behind; otherwise drop it (None in `task_ids` = all).
+    """
+    snapshot = _snapshots.get(board_id)
+    if snapshot is None:
+        return
+    if new is None or None in task_ids or snapshot.generation != new - 1:
+        with _lock:
+            _snapshots.pop(board_id, None)
+        return
+    updated = snapshot.patched(new, task_ids, load_records(board_id, task_ids))
+    with _lock:
+        if _snapshots.get(board_id) is snapshot:
+            _snapshots[board_id] = updated
+        else:
+            _snapshots.pop(board_id, None)
+
+
+def tasks_changed(board_id, task_ids=None):
+    """
+    Record changed tasks of a board (None = the whole board). The first
+    call in a transaction advances the board's generation; the changes of
+    the transaction are applied together once it commits.
+    """
+    key = (NAMESPACE, board_id)
+    apply = None if is_pending(key) else partial(_apply, board_id, Board.advance_task_generation(board_id))
+    on_commit_once(key, apply, [None] if task_ids is None else task_ids)
+
+
+def _sort_key(field, nulls_last, record):
+    """Sort key placing NULLs like the database does."""
+    value = getattr(record, field)
+    if value is None:
+        return (1,) if nulls_last else (0,)
+    return (0, value) if nulls_last else (1, value)
+
+
+def sort_records(records, ordering):
+    """Sort records like `ORDER BY` with the given DRF ordering terms."""
+    records = list(records)
+    nulls_last = connection.vendor in ('postgresql', 'oracle')
+    for term in reversed(ordering):
+        field = term.lstrip('-')
+        records.sort(key=partial(_sort_key, field, nulls_last), reverse=term.startswith('-'))
+    return records
+
+
+def _field_predicates(data, now):
+    """Build record predicates from the cleaned TaskFilter form data."""
+    predicates = [
+        partial(lambda field, value, record: getattr(record, field) == value, field, data[field])
+        for field in FILTER_FIELDS if data.get(field)
+    ]
+    if data.get('due_after') is not None:
+        predicates.append(lambda record: record.due_date >= data['due_after'])
+    if data.get('due_before') is not None:
+        predicates.append(lambda record: record.due_date < data['due_before'])
+    if data.get('overdue') is not None:
+        predicates.append(lambda record: _is_overdue(record, now) is data['overdue'])
+    return predicates
+
+
+def _search_predicates(terms):
+    """Build one case-insensitive `icontains` predicate per search term."""
+    return [
+        partial(lambda term, record: any(term in getattr(record, f).casefold() for f in SEARCH_FIELDS), term)
+        for term in (term.casefold() for term in terms)
+    ]
+
+
+def _is_overdue(record, now):
+    """Past its due date and not done."""
+    return record.due_date < now and record.status != 'done'
+
+
+def query(view):
+    """
+    Return the task records matching the view's request, in order, or None
+    if the request needs the database path (unknown parameters, invalid
+    filters or ordering by a relation).
+    """
+    request = view.request
+    if not SUPPORTED_PARAMS.issuperset(request.query_params):
+        return None
+    filterset = TaskFilter(request.query_params, queryset=Task.objects.none())
+    ordering = filters.OrderingFilter().get_ordering(request, Task.objects.none(), view)
+    if not filterset.is_valid() or not ORDERABLE_FIELDS.issuperset(term.lstrip('-') for term in ordering):
+        return None
+    snapshot = get_snapshot(view.board.pk)
+    if snapshot is None:
+        return None
+    terms = filters.SearchFilter().get_search_terms(request)
+    predicates = _field_predicates(filterset.form.cleaned_data, timezone.now()) + _search_predicates(terms)
+    return [record for record in snapshot.ordered(ordering) if all(match(record) for match in predicates)]
+
+
+def render(record):
+    """Return the record serialized exactly like TaskSerializer does it."""
+    if record.data is None:
+        record.data = _serialize(record)
+    return record.data
+
+
+def _serialize(record):
+    """Build the TaskSerializer representation of a record."""
+    return {
+        'id': str(record.id),
+        'title': record.title,
+        'description': record.description,
+        'due_date': _datetime.to_representation(record.due_date),
+        'priority': record.priority,
+        'category': record.category,
+        'status': record.status,
+        'assigned_to': [str(contact_id) for contact_id in record.assigned_to],
+        'subtasks': [
+            {'id': str(sub.id), 'title': sub.title, 'completed': sub.completed, 'order': sub.order}
+            for sub in record.subtasks
+        ],
+        'order': record.order,
+        'version': record.version,
+        'created_at': _datetime.to_representation(record.created_at),
+        'updated_at': _datetime.to_representation(record.updated_at),
+    }
+
+
+def _summary(total, by_status, by_priority, overdue, upcoming):
+    """Shape the summary response."""
+    return {
+        'total': total,
+        'by_status': by_status,
+        'by_priority': by_priority,
+        'overdue': overdue,
+        'upcoming_deadline': _datetime.to_representation(upcoming) if upcoming else None,
+    }
+
+
+def summarize(records, now):
+    """Summarize task records in a single pass."""
+    by_status, by_priority = dict.fromkeys(STATUSES, 0), dict.fromkeys(PRIORITIES, 0)
+    overdue, upcoming = 0, None
+    for record in records:
+        by_status[record.status] = by_status.get(record.status, 0) + 1
+        by_priority[record.priority] = by_priority.get(record.priority, 0) + 1
+        overdue += _is_overdue(record, now)
+        if record.priority == 'urgent' and record.status != 'done':
+            upcoming = record.due_date if upcoming is None else min(upcoming, record.due_date)
+    return _summary(len(records), by_status, by_priority, overdue, upcoming)
+
+
+def summarize_queryset(queryset, now):
+    """Summarize a task queryset with one aggregate query."""
+    not_done = ~Q(status='done')
+    row = queryset.order_by().aggregate(
+        total=Count('id'),
+        overdue=Count('id', filter=not_done & Q(due_date__lt=now)),
+        upcoming=Min('due_date', filter=not_done & Q(priority='urgent')),
+        **{f'status_{status}': Count('id', filter=Q(status=status)) for status in STATUSES},
+        **{f'priority_{priority}': Count('id', filter=Q(priority=priority)) for priority in PRIORITIES},
+    )
+    by_status = {status: row[f'status_{status}'] for status in STATUSES}
+    by_priority = {priority: row[f'priority_{priority}'] for priority in PRIORITIES}
+    return _summary(row['total'], by_status, by_priority, row['overdue'], row['upcoming'])
+
+
+class ReadModelListMixin:
+    """
+    ViewSet mixin serving `list` from the read model when TASK_READ_MODEL
+    is enabled; place it between the response cache and the model viewset.
+    The async list view uses `read_model_data` as well.
+    """
+
+    def read_model_data(self):
+        """Return the list data from memory, or None if the database must answer."""
+        records = query(self) if settings.TASK_READ_MODEL else None
+        return None if records is None else [render(record) for record in records]
+
+    def list(self, request, *args, **kwargs):
+        """List tasks from memory, or from the database as a fallback."""
+        data = self.read_model_data()
+        if data is None:
+            return super().list(request, *args, **kwargs)
+        return Response(data)
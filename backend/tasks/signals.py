@@ -0,0 +1,60 @@
+"""
+Signal handlers that invalidate (and optionally refill) cached task responses
+and the contact responses carrying assignment counts, and keep the
+in-process task read model current.
+"""
+from django.conf import settings
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+from boards.scoping import board_namespace
+from core.response_cache import bump_generation
+from jobs.queue import enqueue_on_commit
+from . import read_model
+from .models import Task, Subtask
+
+
+def _invalidate(board_id, task_ids=None):
+    """
+    Bump the board's task namespace, schedule a cache refill and hand the
+    changed tasks (None = all of them) to the read model.
+    """
+    bump_generation(board_namespace('tasks', board_id))
+    if settings.RESPONSE_CACHE_WARM:
+        enqueue_on_commit('tasks.warm_list', board_id=board_id)
+    if settings.TASK_READ_MODEL:
+        read_model.tasks_changed(board_id, task_ids)
+
+
+def _invalidate_assignment_counts(board_id):
+    """Bump the board's contact namespace, whose responses count assigned tasks."""
+    bump_generation(board_namespace('contacts', board_id))
+    if settings.RESPONSE_CACHE_WARM:
+        enqueue_on_commit('contacts.warm_list', board_id=board_id)
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def invalidate_task_responses(sender, instance, **kwargs):
+    """Invalidate cached task responses of the board after a write."""
+    _invalidate(instance.board_id, [instance.pk])
+
+
+@receiver(post_delete, sender=Task)
+def invalidate_deleted_assignments(sender, instance, **kwargs):
+    """Deleting a task removes its assignments without an m2m_changed signal."""
+    _invalidate_assignment_counts(instance.board_id)
+
+
+@receiver(post_save, sender=Subtask)
+@receiver(post_delete, sender=Subtask)
+def invalidate_subtask_responses(sender, instance, **kwargs):
+    """Invalidate cached task responses of the board after a subtask write."""
+    _invalidate(instance.board_id, [instance.task_id])
+
+
+@receiver(m2m_changed, sender=Task.assigned_to.through)
+def invalidate_task_assignments(sender, instance, action, reverse, pk_set, **kwargs):
+    """Invalidate cached task and contact responses of the board after assignments change."""
+    if action.startswith('post_'):
+        _invalidate(instance.board_id, pk_set if reverse else [instance.pk])
+        _invalidate_assignment_counts(instance.board_id)
@@ -0,0 +1,18 @@
+"""
+Native async read views for users, used when ASYNC_READ_VIEWS is enabled.
+"""
+from core.async_api import async_read_view, json_response
+from .serializers import UserSerializer
+from .views import current_user_view as current_user_fallback
+
+
+@async_read_view(current_user_fallback)
+async def current_user_view(request):
+    """
+    Get current authenticated user details without a worker thread.
+
+    GET /api/auth/me/
+    """
+    user_data = UserSerializer(request.user).data
+    user_data['createdAt'] = request.user.date_joined
+    return json_response(user_data)
@@ -37,11 +37,14 @@ class RegisterSerializer(serializers.ModelSerializer):
         return data
     
     def _generate_unique_username(self, email):
-        """Generate a unique username from email."""
+        """Generate a unique username from email with a single lookup."""
         username = email.split('@')[0]
         base_username = username
         counter = 1
-        while User.objects.filter(username=username).exists():
+        taken = set(
+            User.objects.filter(username__startswith=base_username).values_list('username', flat=True)
+        )
+        while username in taken:
             username = f"{base_username}{counter}"
             counter += 1
         return username
@@ -1,13 +1,19 @@
 """
 URL configuration for user authentication API.
 """
+from django.conf import settings
 from django.urls import path
 from .views import register_view, login_view, logout_view, current_user_view, guest_login_view
+from . import async_views
 
 urlpatterns = [
     path('register/', register_view, name='register'),
     path('login/', login_view, name='login'),
     path('guest-login/', guest_login_view, name='guest-login'),
     path('logout/', logout_view, name='logout'),
-    path('me/', current_user_view, name='current-user'),
+    path(
+        'me/',
+        async_views.current_user_view if settings.ASYNC_READ_VIEWS else current_user_view,
+        name='current-user',
+    ),
 ]
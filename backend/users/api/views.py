@@ -2,29 +2,18 @@
 API views for user authentication.
 """
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from rest_framework.authtoken.models import Token
 from django.contrib.auth import authenticate, get_user_model
 from .serializers import RegisterSerializer, LoginSerializer, UserSerializer
-from contacts.models import Contact
+from core.throttling import AuthThrottle
+from jobs.queue import enqueue
 
 User = get_user_model()
 
 
-def _create_contact_from_user(user):
-    """Create a contact entry for a newly registered user."""
-    name_parts = user.name.split(' ', 1) if user.name else ['', '']
-    firstname = name_parts[0]
-    lastname = name_parts[1] if len(name_parts) > 1 else ''
-    
-    Contact.objects.get_or_create(
-        email=user.email,
-        defaults={'firstname': firstname, 'lastname': lastname, 'phone': ''}
-    )
-
-
 def _prepare_user_response(user, token):
     """Prepare user data with token for response."""
     user_data = UserSerializer(user).data
@@ -34,9 +23,10 @@ def _prepare_user_response(user, token):
 
 @api_view(['POST'])
 @permission_classes([AllowAny])
+@throttle_classes([AuthThrottle])
 def register_view(request):
     """
-    Register a new user and create a contact entry.
+    Register a new user; the contact entry is created by a background job.
     
     POST /api/auth/register/
     {
@@ -52,8 +42,8 @@ def register_view(request):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
     user = serializer.save()
-    token, _ = Token.objects.get_or_create(user=user)
-    _create_contact_from_user(user)
+    token = Token.objects.create(user=user)
+    enqueue('users.provision_contact', user_id=user.pk)
     
     response_data = _prepare_user_response(user, token)
     return Response(response_data, status=status.HTTP_201_CREATED)
@@ -71,6 +61,7 @@ def _authenticate_user(request, email, password):
 
 @api_view(['POST'])
 @permission_classes([AllowAny])
+@throttle_classes([AuthThrottle])
 def login_view(request):
     """
     Login a user and return auth token.
@@ -99,8 +90,12 @@ def login_view(request):
 
 @api_view(['POST'])
 @permission_classes([AllowAny])
+@throttle_classes([AuthThrottle])
 def guest_login_view(request):
-    """Guest login - creates guest user if not exists and logs in."""
+    """
+    Guest login - creates guest user if not exists and logs in.
+    The guest contact is provisioned in the background on first login.
+    """
     guest_email = 'guest@join.com'
     guest_password = 'guest123'
     
@@ -117,8 +112,7 @@ def guest_login_view(request):
             name='Guest User',
             is_active=True,
         )
-    
-    _create_contact_from_user(user)
+        enqueue('users.provision_contact', user_id=user.pk)
     
     token, _ = Token.objects.get_or_create(user=user)
     response_data = _prepare_user_response(user, token)
@@ -0,0 +1,23 @@
+"""
+Background jobs for users.
+"""
+from django.contrib.auth import get_user_model
+from boards.models import Board
+from contacts.models import Contact
+from jobs.queue import job
+
+User = get_user_model()
+
+
+@job('users.provision_contact')
+def provision_contact(user_id):
+    """Create a contact entry for a user on the default board."""
+    user = User.objects.get(pk=user_id)
+    name_parts = user.name.split(' ', 1) if user.name else ['', '']
+    firstname = name_parts[0]
+    lastname = name_parts[1] if len(name_parts) > 1 else ''
+    Contact.objects.get_or_create(
+        board=Board.get_default(),
+        email=user.email,
+        defaults={'firstname': firstname, 'lastname': lastname, 'phone': ''}
+    )
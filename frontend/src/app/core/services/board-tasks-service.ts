@@ -170,11 +170,12 @@ export class BoardTasksService {
 
   /**
    * Updates an existing task via the backend API.
+   * Sends a PATCH so only the given fields are written.
    */
   async updateTask(taskId: string, updates: Partial<Task>): Promise<void> {
     try {
       const apiUpdates = this.convertFrontendTaskToApi(updates);
-      await this.http.put(`${this.apiUrl}${taskId}/`, apiUpdates).toPromise();
+      await this.http.patch(`${this.apiUrl}${taskId}/`, apiUpdates).toPromise();
       await this.loadTasks(); // Refresh tasks
     } catch (error) {
       console.error('Backend update failed:', error);